@@ -9,6 +9,11 @@ import argparse
 from pathlib import Path
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -16,6 +21,64 @@ from record_keeper import RecordKeeper
 from logger import setup_logger
 
 
+def _print_stats(record_keeper: RecordKeeper, args: argparse.Namespace) -> None:
+    """Print processing statistics for the requested period."""
+    print(f"Processing Statistics (Last {args.days} days)")
+    print("-" * 70)
+
+    stats = record_keeper.get_processing_stats(args.days)
+
+    print(f"Total Processed: {stats['total_processed']}")
+    print(f"  ✓ Successful: {stats['successful']}")
+    print(f"  ✗ Failed: {stats['failed']}")
+    print(f"  ○ Skipped: {stats['skipped']}")
+    print(f"\nAverage Processing Time: {stats['avg_processing_time_sec']:.2f} seconds")
+    print(f"\nOriginal Images Size: {stats['total_original_size_gb']:.2f} GB")
+    print(f"Enhanced Images Size: {stats['total_enhanced_size_gb']:.2f} GB")
+
+    if stats['successful'] > 0:
+        error_rate = (stats['failed'] / (stats['successful'] + stats['failed'])) * 100
+        print(f"Error Rate: {error_rate:.2f}%")
+
+    print()
+
+
+def _print_csv(record_keeper: RecordKeeper, args: argparse.Namespace) -> None:
+    """Export records for the requested period to CSV."""
+    print(f"Exporting CSV Report (Last {args.days} days)")
+    print("-" * 70)
+
+    csv_path = record_keeper.export_to_csv(days=args.days, workers=args.parallel)
+    print(f"✓ CSV exported to: {csv_path}")
+    print()
+
+
+def _print_errors(record_keeper: RecordKeeper, args: argparse.Namespace) -> None:
+    """Print the most frequent errors for the requested period."""
+    print(f"Error Summary (Last {args.days} days)")
+    print("-" * 70)
+
+    errors = record_keeper.get_error_summary(args.days)
+
+    if errors:
+        for error in errors[:10]:  # Top 10 errors
+            print(f"✗ {error['error']}")
+            print(f"  Count: {error['count']} occurrences")
+            print(f"  Last seen: {error['last_seen']}")
+            print()
+    else:
+        print("✓ No errors found!")
+        print()
+
+
+# Report type -> generator, in output order ("all" runs every entry)
+REPORTS = {
+    "stats": _print_stats,
+    "csv": _print_csv,
+    "errors": _print_errors,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate processing reports and cleanup manifests"
@@ -30,7 +93,7 @@ def main():
 
     parser.add_argument(
         "--report-type",
-        choices=["stats", "csv", "errors", "all"],
+        choices=[*REPORTS, "all"],
         default="stats",
         help="Type of report to generate"
     )
@@ -42,11 +105,18 @@ def main():
         help="Number of days to include in report"
     )
 
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Worker processes for CSV export (writes monthly shards in parallel)"
+    )
+
     args = parser.parse_args()
 
     # Load config
     with open(args.config) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAMLLoader)
 
     # Setup logger
     logger = setup_logger(config)
@@ -59,49 +129,11 @@ def main():
     print(f"{'=' * 70}\n")
 
     # Generate requested reports
-    if args.report_type in ["stats", "all"]:
-        print(f"Processing Statistics (Last {args.days} days)")
-        print("-" * 70)
-
-        stats = record_keeper.get_processing_stats(args.days)
-
-        print(f"Total Processed: {stats['total_processed']}")
-        print(f"  ✓ Successful: {stats['successful']}")
-        print(f"  ✗ Failed: {stats['failed']}")
-        print(f"  ○ Skipped: {stats['skipped']}")
-        print(f"\nAverage Processing Time: {stats['avg_processing_time_sec']:.2f} seconds")
-        print(f"\nOriginal Images Size: {stats['total_original_size_gb']:.2f} GB")
-        print(f"Enhanced Images Size: {stats['total_enhanced_size_gb']:.2f} GB")
-
-        if stats['successful'] > 0:
-            error_rate = (stats['failed'] / (stats['successful'] + stats['failed'])) * 100
-            print(f"Error Rate: {error_rate:.2f}%")
+    for report_type, generate in REPORTS.items():
+        if args.report_type in ("all", report_type):
+            generate(record_keeper, args)
 
-        print()
-
-    if args.report_type in ["csv", "all"]:
-        print(f"Exporting CSV Report (Last {args.days} days)")
-        print("-" * 70)
-
-        csv_path = record_keeper.export_to_csv(days=args.days)
-        print(f"✓ CSV exported to: {csv_path}")
-        print()
-
-    if args.report_type in ["errors", "all"]:
-        print(f"Error Summary (Last {args.days} days)")
-        print("-" * 70)
-
-        errors = record_keeper.get_error_summary(args.days)
-
-        if errors:
-            for error in errors[:10]:  # Top 10 errors
-                print(f"✗ {error['error']}")
-                print(f"  Count: {error['count']} occurrences")
-                print(f"  Last seen: {error['last_seen']}")
-                print()
-        else:
-            print("✓ No errors found!")
-            print()
+    record_keeper.close()
 
     print(f"{'=' * 70}\n")
 
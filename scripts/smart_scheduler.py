@@ -8,10 +8,46 @@ import sys
 import yaml
 import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+import os
 import subprocess
+import threading
 import logging
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# The scheduler log format uses no thread/process fields; skip collecting
+# them on every log record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# CPU usage is sampled over this interval; the scheduler is a one-shot process,
+# so there is no earlier reading to measure from
+CPU_SAMPLE_SECONDS = 0.1
+
+
+@lru_cache(maxsize=None)
+def _hhmm_to_seconds(hhmm: str) -> int:
+    """Convert an "HH:MM" string to seconds since midnight."""
+    hour, minute = map(int, hhmm.split(":"))
+    return hour * 3600 + minute * 60
+
+
+def _seconds_since_midnight(now: datetime) -> int:
+    """Return whole seconds elapsed since midnight for the given time."""
+    return now.hour * 3600 + now.minute * 60 + now.second
+
 
 class SmartScheduler:
     """
@@ -25,12 +61,36 @@ class SmartScheduler:
     def __init__(self, config_path: Path):
         """Initialize scheduler with configuration."""
         with open(config_path) as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=_YAMLLoader)
 
         self.setup_logging()
         self.photoner_path = Path(__file__).parent.parent / "src" / "photo_enhancer.py"
         self.config_path = config_path
 
+        # Bind config subtrees once instead of walking nested dicts per tick
+        self._sched = self.config["scheduling"]
+        self._sched_archive = self._sched["archive_processing"]
+        self._sched_catchup = self._sched["current_catchup"]
+        self._sched_periodic = self._sched["current_periodic"]
+        self._res = self.config["resources"]
+        self._archive_batch = self._res["archive"]["max_batch_size"]
+        self._catchup_batch = self._res["current_catchup"]["max_batch_size"]
+        self._periodic_batch = self._res["current_periodic"]["max_batch_size"]
+
+        # Archive runtime limit in minutes (wraps past midnight if end < start)
+        self._archive_runtime_min = (
+            _hhmm_to_seconds(self._sched_archive["end_time"]) -
+            _hhmm_to_seconds(self._sched_archive["start_time"])
+        ) % 86400 // 60
+
+        # Precompute values used on every scheduler tick
+        self._photoner_path_str = str(self.photoner_path)
+        self._config_path_str = str(self.config_path)
+        self._sync_times = [
+            (sync_time_str, _hhmm_to_seconds(sync_time_str))
+            for sync_time_str in self._sched["google_drive_sync_times"]
+        ]
+
     def setup_logging(self):
         """Setup logging for scheduler."""
         log_dir = Path(self.config["paths"]["logs"])
@@ -56,19 +116,13 @@ class SmartScheduler:
         Returns:
             True if in sync window
         """
-        now = datetime.now()
-        sync_times = self.config["scheduling"]["google_drive_sync_times"]
-
-        for sync_time_str in sync_times:
-            sync_hour, sync_min = map(int, sync_time_str.split(":"))
-            sync_time = now.replace(hour=sync_hour, minute=sync_min, second=0)
+        now_seconds = _seconds_since_midnight(datetime.now())
+        buffer_seconds = buffer_minutes * 60
 
+        for sync_time_str, sync_seconds in self._sync_times:
             # Check if within buffer window
-            start_buffer = sync_time - timedelta(minutes=buffer_minutes)
-            end_buffer = sync_time + timedelta(minutes=buffer_minutes)
-
-            if start_buffer <= now <= end_buffer:
-                self.logger.info(f"In sync window for {sync_time_str} (buffer: {buffer_minutes} min)")
+            if sync_seconds - buffer_seconds <= now_seconds <= sync_seconds + buffer_seconds:
+                self.logger.info("In sync window for %s (buffer: %d min)", sync_time_str, buffer_minutes)
                 return True
 
         return False
@@ -84,56 +138,93 @@ class SmartScheduler:
         Returns:
             True if in window
         """
-        now = datetime.now()
-        start_hour, start_min = map(int, start_time.split(":"))
-        end_hour, end_min = map(int, end_time.split(":"))
-
-        start = now.replace(hour=start_hour, minute=start_min, second=0)
-        end = now.replace(hour=end_hour, minute=end_min, second=0)
-
-        return start <= now <= end
+        now_seconds = _seconds_since_midnight(datetime.now())
+        return _hhmm_to_seconds(start_time) <= now_seconds <= _hhmm_to_seconds(end_time)
 
     def check_nas_resources(self) -> dict:
         """
         Check NAS resource usage.
 
+        Uses psutil when installed, otherwise /proc/stat and statvfs directly.
+        No external processes are spawned except the macOS CPU fallback.
+
         Returns:
             Dictionary with resource metrics
         """
         try:
-            # CPU usage
-            cpu_output = subprocess.check_output(
-                ["top", "-l", "1", "-n", "0"],
-                text=True
-            )
-            # Parse CPU line (macOS format, adjust for Linux if needed)
-            # This is a simplified version
+            enhanced_path = self.config["paths"]["enhanced"]
 
-            # Disk space
-            disk_output = subprocess.check_output(
-                ["df", "-h", self.config["paths"]["enhanced"]],
-                text=True
-            )
-            lines = disk_output.strip().split('\n')
-            if len(lines) > 1:
-                parts = lines[1].split()
-                disk_usage_percent = int(parts[4].rstrip('%'))
+            if PSUTIL_AVAILABLE:
+                cpu_percent = psutil.cpu_percent(interval=CPU_SAMPLE_SECONDS)
+                disk_usage_percent = psutil.disk_usage(enhanced_path).percent
             else:
-                disk_usage_percent = 0
+                cpu_percent = self._read_cpu_percent()
+                disk_usage_percent = self._read_disk_usage_percent(enhanced_path)
 
             return {
-                "cpu_percent": 0,  # Placeholder - implement actual parsing
+                "cpu_percent": cpu_percent,
                 "disk_usage_percent": disk_usage_percent,
                 "status": "ok"
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to check resources: {e}")
+            self.logger.error("Failed to check resources: %s", e)
             return {"status": "error"}
 
+    def _read_cpu_percent(self, sample_seconds: float = CPU_SAMPLE_SECONDS) -> float:
+        """
+        Measure CPU utilisation without psutil.
+
+        Args:
+            sample_seconds: Interval between the two /proc/stat samples
+
+        Returns:
+            CPU busy percentage (0 if it cannot be determined)
+        """
+        if sys.platform.startswith("linux"):
+            def read_proc_stat():
+                with open("/proc/stat") as f:
+                    fields = [int(value) for value in f.readline().split()[1:]]
+                # idle + iowait count as idle time
+                return fields[3] + fields[4], sum(fields)
+
+            idle_start, total_start = read_proc_stat()
+            time.sleep(sample_seconds)
+            idle_end, total_end = read_proc_stat()
+
+            total_delta = total_end - total_start
+            if total_delta <= 0:
+                return 0.0
+            return round(100 * (1 - (idle_end - idle_start) / total_delta), 1)
+
+        if sys.platform == "darwin":
+            # macOS fallback: "CPU usage: 5.12% user, 3.4% sys, 91.47% idle"
+            top_output = subprocess.check_output(["top", "-l", "1", "-n", "0"], text=True)
+            for line in top_output.splitlines():
+                if line.startswith("CPU usage:"):
+                    idle = float(line.rsplit(",", 1)[1].split("%")[0])
+                    return round(100 - idle, 1)
+
+        return 0.0
+
+    def _read_disk_usage_percent(self, path: str) -> float:
+        """
+        Compute used-space percentage for the filesystem holding path.
+
+        Args:
+            path: Any path on the filesystem to check
+
+        Returns:
+            Percentage of blocks in use
+        """
+        stat = os.statvfs(path)
+        if stat.f_blocks == 0:
+            return 0.0
+        return round((stat.f_blocks - stat.f_bavail) / stat.f_blocks * 100, 1)
+
     def should_run_archive_processing(self) -> bool:
         """Check if archive processing should run."""
-        config = self.config["scheduling"]["archive_processing"]
+        config = self._sched_archive
 
         if not config["enabled"]:
             return False
@@ -152,7 +243,7 @@ class SmartScheduler:
 
     def should_run_current_catchup(self) -> bool:
         """Check if current photo catchup should run."""
-        config = self.config["scheduling"]["current_catchup"]
+        config = self._sched_catchup
 
         if not config["enabled"]:
             return False
@@ -164,7 +255,7 @@ class SmartScheduler:
         # Check pause windows (e.g., 6 AM sync)
         for pause_window in config.get("pause_windows", []):
             if self.is_in_time_window(pause_window["start"], pause_window["end"]):
-                self.logger.info(f"In pause window {pause_window['start']}-{pause_window['end']}")
+                self.logger.info("In pause window %s-%s", pause_window["start"], pause_window["end"])
                 return False
 
         # Check sync window
@@ -175,7 +266,7 @@ class SmartScheduler:
 
     def should_run_current_periodic(self) -> bool:
         """Check if periodic current photo processing should run."""
-        config = self.config["scheduling"]["current_periodic"]
+        config = self._sched_periodic
 
         if not config["enabled"]:
             return False
@@ -210,37 +301,65 @@ class SmartScheduler:
         """
         cmd = [
             "python",
-            str(self.photoner_path),
-            "--config", str(self.config_path),
+            self._photoner_path_str,
+            "--config", self._config_path_str,
             "--mode", mode,
             "--batch-size", str(batch_size)
         ]
 
-        self.logger.info(f"Starting {mode} processing (batch: {batch_size})")
+        self.logger.info("Starting %s processing (batch: %d)", mode, batch_size)
 
         try:
-            result = subprocess.run(
+            # Stream child output line by line so memory stays bounded and
+            # progress shows up in the scheduler log while the batch runs
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=max_runtime_minutes * 60 if max_runtime_minutes else None
+                bufsize=1
+            )
+            output_thread = threading.Thread(
+                target=self._forward_output, args=(proc, mode), daemon=True
             )
+            output_thread.start()
+
+            try:
+                returncode = proc.wait(timeout=max_runtime_minutes * 60 if max_runtime_minutes else None)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                output_thread.join()
+                self.logger.warning("%s processing timed out after %s minutes", mode, max_runtime_minutes)
+                return False
+
+            output_thread.join()
 
-            if result.returncode == 0:
-                self.logger.info(f"{mode} processing completed successfully")
+            if returncode == 0:
+                self.logger.info("%s processing completed successfully", mode)
                 return True
             else:
-                self.logger.error(f"{mode} processing failed: {result.stderr}")
+                self.logger.error("%s processing failed with exit code %d", mode, returncode)
                 return False
 
-        except subprocess.TimeoutExpired:
-            self.logger.warning(f"{mode} processing timed out after {max_runtime_minutes} minutes")
-            return False
-
         except Exception as e:
-            self.logger.error(f"Error running {mode} processing: {e}")
+            self.logger.error("Error running %s processing: %s", mode, e)
             return False
 
+    def _forward_output(self, proc: subprocess.Popen, mode: str) -> None:
+        """
+        Forward a child process's combined stdout/stderr to the scheduler log.
+
+        Args:
+            proc: Running photo enhancer process
+            mode: Processing mode (used as a log prefix)
+        """
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                self.logger.info("[%s] %s", mode, line)
+        proc.stdout.close()
+
     def run(self):
         """Main scheduler loop."""
         self.logger.info("=" * 80)
@@ -252,28 +371,20 @@ class SmartScheduler:
         catchup = self.should_run_current_catchup()
         periodic = self.should_run_current_periodic()
 
-        self.logger.info(f"Archive Processing: {'YES' if archive else 'NO'}")
-        self.logger.info(f"Current Catchup: {'YES' if catchup else 'NO'}")
-        self.logger.info(f"Current Periodic: {'YES' if periodic else 'NO'}")
+        self.logger.info("Archive Processing: %s", "YES" if archive else "NO")
+        self.logger.info("Current Catchup: %s", "YES" if catchup else "NO")
+        self.logger.info("Current Periodic: %s", "YES" if periodic else "NO")
 
         # Check resources
         resources = self.check_nas_resources()
-        self.logger.info(f"NAS Resources: {resources}")
+        self.logger.info("NAS Resources: %s", resources)
 
         # Run appropriate task
         if archive:
-            config = self.config["scheduling"]["archive_processing"]
-            batch_size = self.config["resources"]["archive"]["max_batch_size"]
-            max_runtime = (
-                datetime.strptime(config["end_time"], "%H:%M") -
-                datetime.strptime(config["start_time"], "%H:%M")
-            ).seconds // 60
-
-            self.run_processing("archive", batch_size, max_runtime)
+            self.run_processing("archive", self._archive_batch, self._archive_runtime_min)
 
         elif catchup:
-            config = self.config["scheduling"]["current_catchup"]
-            batch_size = self.config["resources"]["current_catchup"]["max_batch_size"]
+            batch_size = self._catchup_batch
 
             # Calculate time until end or next pause window
             max_runtime = 60  # Default 1 hour chunks
@@ -281,7 +392,7 @@ class SmartScheduler:
             self.run_processing("incoming", batch_size, max_runtime)
 
         elif periodic:
-            batch_size = self.config["resources"]["current_periodic"]["max_batch_size"]
+            batch_size = self._periodic_batch
             max_runtime = 30  # 30 minutes max
 
             self.run_processing("incoming", batch_size, max_runtime)
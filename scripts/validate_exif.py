@@ -4,35 +4,72 @@ EXIF Validation Script
 Validates that EXIF metadata is preserved between original and enhanced images.
 """
 
+import os
 import sys
+import csv
 import argparse
+from multiprocessing import Pool
 from pathlib import Path
 from PIL import Image
 import piexif
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
+
+
+# Critical EXIF fields that must be preserved, built once at import time
+_CRITICAL_0TH = frozenset({
+    piexif.ImageIFD.Make,           # Camera manufacturer
+    piexif.ImageIFD.Model,          # Camera model
+    piexif.ImageIFD.Orientation,    # Image orientation
+    piexif.ImageIFD.XResolution,    # X resolution
+    piexif.ImageIFD.YResolution,    # Y resolution
+    piexif.ImageIFD.Copyright,      # Copyright info
+})
+_CRITICAL_EXIF = frozenset({
+    piexif.ExifIFD.DateTimeOriginal,      # Original date/time
+    piexif.ExifIFD.ExposureTime,          # Shutter speed
+    piexif.ExifIFD.FNumber,               # Aperture
+    piexif.ExifIFD.ISOSpeedRatings,       # ISO
+    piexif.ExifIFD.FocalLength,           # Focal length
+    piexif.ExifIFD.LensModel,             # Lens model
+})
+_CRITICAL_GPS = frozenset({
+    piexif.GPSIFD.GPSLatitude,
+    piexif.GPSIFD.GPSLongitude,
+})
+_CRITICAL = {"0th": _CRITICAL_0TH, "Exif": _CRITICAL_EXIF, "GPS": _CRITICAL_GPS}
 
 
 def extract_exif(image_path: Path) -> Dict[str, Any]:
     """
     Extract EXIF data from image.
 
+    Reads the EXIF segment directly with piexif and only falls back to
+    opening the image with PIL for formats piexif cannot parse.
+
     Args:
         image_path: Path to image
 
     Returns:
-        Dictionary of EXIF data
+        Dictionary of EXIF data (empty if the image has none)
     """
     try:
-        with Image.open(image_path) as img:
-            if "exif" in img.info:
+        exif_dict = piexif.load(str(image_path))
+    except Exception:
+        try:
+            with Image.open(image_path) as img:
+                if "exif" not in img.info:
+                    return {}
                 exif_dict = piexif.load(img.info["exif"])
-                return exif_dict
-            else:
-                return {}
-    except Exception as e:
-        print(f"Error extracting EXIF from {image_path}: {e}")
+        except Exception as e:
+            print(f"Error extracting EXIF from {image_path}: {e}")
+            return {}
+
+    # piexif returns empty IFDs for images without EXIF
+    if not any(exif_dict.get(ifd) for ifd in ("0th", "Exif", "GPS", "Interop", "1st")):
         return {}
 
+    return exif_dict
+
 
 def compare_exif(original_exif: Dict, enhanced_exif: Dict) -> Tuple[bool, Dict[str, Any]]:
     """
@@ -45,78 +82,77 @@ def compare_exif(original_exif: Dict, enhanced_exif: Dict) -> Tuple[bool, Dict[s
     Returns:
         Tuple of (is_preserved, differences)
     """
-    # Critical EXIF fields that must be preserved
-    critical_fields = {
-        "0th": [
-            piexif.ImageIFD.Make,           # Camera manufacturer
-            piexif.ImageIFD.Model,          # Camera model
-            piexif.ImageIFD.Orientation,    # Image orientation
-            piexif.ImageIFD.XResolution,    # X resolution
-            piexif.ImageIFD.YResolution,    # Y resolution
-            piexif.ImageIFD.Copyright,      # Copyright info
-        ],
-        "Exif": [
-            piexif.ExifIFD.DateTimeOriginal,      # Original date/time
-            piexif.ExifIFD.ExposureTime,          # Shutter speed
-            piexif.ExifIFD.FNumber,               # Aperture
-            piexif.ExifIFD.ISOSpeedRatings,       # ISO
-            piexif.ExifIFD.FocalLength,           # Focal length
-            piexif.ExifIFD.LensModel,             # Lens model
-        ],
-        "GPS": [
-            piexif.GPSIFD.GPSLatitude,
-            piexif.GPSIFD.GPSLongitude,
-        ],
-    }
-
     differences = {
         "missing_fields": [],
         "changed_fields": [],
         "present_fields": [],
     }
 
-    is_preserved = True
-
-    for ifd_name, field_ids in critical_fields.items():
+    for ifd_name, field_ids in _CRITICAL.items():
         original_ifd = original_exif.get(ifd_name, {})
         enhanced_ifd = enhanced_exif.get(ifd_name, {})
 
-        for field_id in field_ids:
-            original_value = original_ifd.get(field_id)
-            enhanced_value = enhanced_ifd.get(field_id)
-
-            # Skip if field not in original
-            if original_value is None:
-                continue
-
-            # Check if field is preserved
-            if enhanced_value is None:
-                differences["missing_fields"].append({
-                    "ifd": ifd_name,
-                    "field_id": field_id,
-                    "original_value": original_value,
-                })
-                is_preserved = False
-            elif original_value != enhanced_value:
-                differences["changed_fields"].append({
-                    "ifd": ifd_name,
-                    "field_id": field_id,
-                    "original_value": original_value,
-                    "enhanced_value": enhanced_value,
-                })
-                is_preserved = False
-            else:
-                differences["present_fields"].append({
-                    "ifd": ifd_name,
-                    "field_id": field_id,
-                })
+        # Only fields present in the original need to be preserved
+        relevant = field_ids & original_ifd.keys()
+        kept = relevant & enhanced_ifd.keys()
+        missing = relevant - kept
+        changed = {f for f in kept if original_ifd[f] != enhanced_ifd[f]}
+
+        differences["missing_fields"].extend(
+            {"ifd": ifd_name, "field_id": f, "original_value": original_ifd[f]}
+            for f in sorted(missing)
+        )
+        differences["changed_fields"].extend(
+            {
+                "ifd": ifd_name,
+                "field_id": f,
+                "original_value": original_ifd[f],
+                "enhanced_value": enhanced_ifd[f],
+            }
+            for f in sorted(changed)
+        )
+        differences["present_fields"].extend(
+            {"ifd": ifd_name, "field_id": f} for f in sorted(kept - changed)
+        )
+
+    is_preserved = not differences["missing_fields"] and not differences["changed_fields"]
 
     return is_preserved, differences
 
 
+def check_exif_preservation(original_path: Path, enhanced_path: Path) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Check EXIF preservation between images without printing anything.
+
+    Args:
+        original_path: Path to original image
+        enhanced_path: Path to enhanced image
+
+    Returns:
+        Tuple of (is_preserved, differences). When the fields could not be
+        compared, differences holds only a "message" explaining why.
+    """
+    # Check files exist
+    if not original_path.exists():
+        return False, {"message": f"Original file not found: {original_path}"}
+
+    if not enhanced_path.exists():
+        return False, {"message": f"Enhanced file not found: {enhanced_path}"}
+
+    original_exif = extract_exif(original_path)
+    if not original_exif:
+        return True, {"message": "Original image has no EXIF data"}  # No EXIF to preserve
+
+    enhanced_exif = extract_exif(enhanced_path)
+    if not enhanced_exif:
+        return False, {"message": "Enhanced image has no EXIF data (original had EXIF)"}
+
+    return compare_exif(original_exif, enhanced_exif)
+
+
 def validate_exif_preservation(original_path: Path, enhanced_path: Path, verbose: bool = False) -> bool:
     """
-    Validate EXIF preservation between images.
+    Validate EXIF preservation between images and print a report.
 
     Args:
         original_path: Path to original image
@@ -133,30 +169,12 @@ def validate_exif_preservation(original_path: Path, enhanced_path: Path, verbose
     print(f"Enhanced: {enhanced_path}")
     print(f"{'=' * 70}\n")
 
-    # Check files exist
-    if not original_path.exists():
-        print(f"❌ Original file not found: {original_path}")
-        return False
-
-    if not enhanced_path.exists():
-        print(f"❌ Enhanced file not found: {enhanced_path}")
-        return False
-
-    # Extract EXIF
     print("Extracting EXIF data...")
-    original_exif = extract_exif(original_path)
-    enhanced_exif = extract_exif(enhanced_path)
-
-    if not original_exif:
-        print("⚠️  Original image has no EXIF data")
-        return True  # No EXIF to preserve
+    is_preserved, differences = check_exif_preservation(original_path, enhanced_path)
 
-    if not enhanced_exif:
-        print("❌ Enhanced image has no EXIF data (original had EXIF)")
-        return False
-
-    # Compare EXIF
-    is_preserved, differences = compare_exif(original_exif, enhanced_exif)
+    if "message" in differences:
+        print(f"{'⚠️ ' if is_preserved else '❌'} {differences['message']}")
+        return is_preserved
 
     # Print results
     present_count = len(differences["present_fields"])
@@ -190,6 +208,76 @@ def validate_exif_preservation(original_path: Path, enhanced_path: Path, verbose
     return is_preserved
 
 
+def _validate_pair(pair: Tuple[str, str]) -> Tuple[Tuple[str, str], bool]:
+    """
+    Validate one (original, enhanced) pair without printing a report.
+
+    Args:
+        pair: Tuple of (original path, enhanced path)
+
+    Returns:
+        Tuple of (pair, is_preserved)
+    """
+    is_preserved, _ = check_exif_preservation(Path(pair[0]), Path(pair[1]))
+    return pair, is_preserved
+
+
+def validate_manifest(manifest_path: Path, workers: int = None) -> bool:
+    """
+    Validate EXIF preservation for every pair listed in a CSV manifest.
+
+    Args:
+        manifest_path: CSV file with one "original,enhanced" pair per row
+            (an "original,enhanced" header row is skipped)
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        True if every pair preserved its EXIF, False otherwise
+    """
+    with open(manifest_path, newline="") as f:
+        pairs: List[Tuple[str, str]] = [
+            (row[0].strip(), row[1].strip()) for row in csv.reader(f) if len(row) >= 2
+        ]
+
+    # Skip an "original,enhanced" header row
+    if pairs and (pairs[0][0].lower(), pairs[0][1].lower()) == ("original", "enhanced"):
+        del pairs[0]
+
+    print(f"\n{'=' * 70}")
+    print(f"EXIF Batch Validation")
+    print(f"{'=' * 70}")
+    print(f"Manifest: {manifest_path}")
+    print(f"Pairs: {len(pairs)}")
+    print(f"{'=' * 70}\n")
+
+    passed = 0
+    failures = []
+
+    with Pool(processes=workers or os.cpu_count()) as pool:
+        for pair, ok in pool.imap_unordered(_validate_pair, pairs, chunksize=64):
+            if ok:
+                passed += 1
+            else:
+                failures.append(pair)
+
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {len(failures)}")
+
+    if failures:
+        print("\nFailed pairs:")
+        for original, enhanced in failures:
+            print(f"  - {original} -> {enhanced}")
+
+    print(f"\n{'=' * 70}")
+    if not failures:
+        print("✅ EXIF VALIDATION PASSED - All critical metadata preserved")
+    else:
+        print("❌ EXIF VALIDATION FAILED - Some metadata was lost or changed")
+    print(f"{'=' * 70}\n")
+
+    return not failures
+
+
 def main():
     """Command-line interface for EXIF validation."""
     parser = argparse.ArgumentParser(
@@ -199,17 +287,27 @@ def main():
     parser.add_argument(
         "--original",
         type=Path,
-        required=True,
         help="Path to original image",
     )
 
     parser.add_argument(
         "--enhanced",
         type=Path,
-        required=True,
         help="Path to enhanced image",
     )
 
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="CSV of original,enhanced pairs to validate in parallel",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --manifest (default: CPU count)",
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -218,7 +316,14 @@ def main():
 
     args = parser.parse_args()
 
+    if not args.manifest and not (args.original and args.enhanced):
+        parser.error("--original and --enhanced are required unless --manifest is given")
+
     try:
+        if args.manifest:
+            success = validate_manifest(args.manifest, workers=args.workers)
+            return 0 if success else 1
+
         success = validate_exif_preservation(
             args.original,
             args.enhanced,
@@ -3,15 +3,41 @@ File Manager for Photoner
 Handles directory scanning, file validation, safe file operations, and duplicate detection.
 """
 
+import mmap
 import os
 import shutil
+import sqlite3
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import FrozenSet, List, Dict, Any, Iterator, NamedTuple, Optional, Set, Tuple
 from datetime import datetime
 import hashlib
 
 
+# Free space changes slowly; reuse a disk_usage() result for this long
+DISK_USAGE_TTL_SEC = 30
+
+# Leading bytes of the image formats Photoner reads (RAW formats here are TIFF-based)
+IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"II*\x00",  # TIFF little-endian (also CR2, NEF, ARW, DNG)
+    b"MM\x00*",  # TIFF big-endian
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"BM",  # BMP
+)
+
+
+class FileEntry(NamedTuple):
+    """An input file found during scanning, with its stat result from scan time."""
+
+    path: Path
+    stat: os.stat_result
+
+
 class FileManager:
     """
     Manages all file operations with safety checks and validation.
@@ -31,9 +57,57 @@ class FileManager:
         self.paths = config["paths"]
         self.file_types = config["file_types"]
 
+        # Threads used to walk directory trees (1 = serial)
+        self.scan_workers = config.get("advanced", {}).get(
+            "scan_workers", min(32, (os.cpu_count() or 1) * 4)
+        )
+
+        # Invariants of the scan/queue hot path, computed once
+        self._supported_extensions = frozenset(
+            ext.lower()
+            for file_type in self.file_types.values()
+            if file_type.get("enabled", True)
+            for ext in file_type["extensions"]
+        )
+        # Lower- and upper-case variants so most names match without lowercasing
+        self._ext_suffixes = tuple(sorted(self._supported_extensions)) + tuple(
+            sorted(ext.upper() for ext in self._supported_extensions)
+        )
+        self._replace_with_enhanced = config["processing"].get("replace_with_enhanced", False)
+        self._incoming_prefix = (
+            os.path.join(Path(self.paths["incoming"]).resolve(), "") if self.paths.get("incoming") else None
+        )
+        self._archive_prefix = (
+            os.path.join(Path(self.paths["archive"]).resolve(), "") if self.paths.get("archive") else None
+        )
+        self._enhanced_base = Path(self.paths["enhanced"])
+
+        # Output directories already created this run (skips a mkdir per file)
+        self._known_dirs: Set[Path] = set()
+
+        # Output paths are deterministic per input; they are computed once while
+        # filtering the queue and again when each image is processed
+        self._generate_output_path = lru_cache(maxsize=None)(self._generate_output_path)
+
         # Track processed files to avoid duplicates
         self.processed_files: Set[str] = set()
 
+        # Content-hash index of enhanced originals, so byte-identical copies
+        # reuse an existing result (not used when outputs replace originals)
+        self.content_dedup = config["processing"].get("content_dedup", False) and not config[
+            "processing"
+        ].get("replace_with_enhanced", False)
+        self._content_db_path = Path(self.paths["logs"]) / "database" / "content_hashes.db"
+        self._known_fingerprints: Optional[Set[str]] = None
+        self._content_conn: Optional[sqlite3.Connection] = None
+
+        # (input, output) pairs whose result was copied from identical content
+        # while building the last queue; they still need their originals handled
+        self.reused_outputs: List[Tuple[Path, Path]] = []
+
+        # (monotonic timestamp, shutil.disk_usage result) for check_disk_space
+        self._disk_usage_cache: Optional[Tuple[float, Any]] = None
+
         # Ensure critical directories exist
         self._ensure_directories()
 
@@ -52,7 +126,7 @@ class FileManager:
         for dir_path in critical_dirs:
             if dir_path:  # Skip if None or empty
                 Path(dir_path).mkdir(parents=True, exist_ok=True)
-                self.logger.debug(f"Ensured directory exists: {dir_path}")
+                self.logger.debug("Ensured directory exists: %s", dir_path)
 
     def scan_directory(self, directory: Path, recursive: bool = True) -> List[Path]:
         """
@@ -65,6 +139,22 @@ class FileManager:
         Returns:
             List of image file paths
 
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+        """
+        return [file_entry.path for file_entry in self._scan_entries(directory, recursive)]
+
+    def _scan_entries(self, directory: Path, recursive: bool = True) -> List[FileEntry]:
+        """
+        Scan directory for processable image files, keeping their stat results.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories
+
+        Returns:
+            List of FileEntry (path + stat) for each image file
+
         Raises:
             FileNotFoundError: If directory doesn't exist
         """
@@ -73,29 +163,89 @@ class FileManager:
 
         self.logger.info(f"Scanning directory: {directory}", recursive=recursive)
 
+        ext_suffixes = self._ext_suffixes
+
+        # Scan directory (filter on raw names/strings before building Path objects)
         image_files = []
-        supported_extensions = self._get_supported_extensions()
+        for entry in self._iter_files(str(directory), recursive):
+            name = entry.name
+            # Mixed-case extensions (".Jpg") fall through to the lowercase check
+            if not (name.endswith(ext_suffixes) or name.lower().endswith(ext_suffixes)):
+                continue
+
+            # Skip already processed files if in a "processed" subdirectory
+            if "processed" in entry.path:
+                continue
 
-        # Scan directory
-        pattern = "**/*" if recursive else "*"
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                # Skip already processed files if in a "processed" subdirectory
-                if "processed" not in str(file_path):
-                    image_files.append(file_path)
+            try:
+                # DirEntry caches this, so sorting/filtering won't re-stat
+                image_files.append(FileEntry(Path(entry.path), entry.stat()))
+            except FileNotFoundError:
+                continue  # Removed since the directory was listed
 
         self.logger.info(f"Found {len(image_files)} images in {directory}", count=len(image_files))
         return image_files
 
-    def _get_supported_extensions(self) -> Set[str]:
-        """Get set of all supported file extensions."""
-        extensions = set()
+    def _iter_files(self, root: str, recursive: bool = True) -> Iterator[os.DirEntry]:
+        """
+        Walk a directory tree with os.scandir, yielding file entries.
 
-        for file_type, config in self.file_types.items():
-            if config.get("enabled", True):
-                extensions.update([ext.lower() for ext in config["extensions"]])
+        scandir reports entry types from the directory listing itself, so
+        no per-entry stat() is needed to tell files from directories.
+        Symlinked directories are not followed. When the root has many
+        subdirectories, each subtree is walked on a worker thread (scandir
+        releases the GIL, so NAS round trips overlap).
 
-        return extensions
+        Args:
+            root: Directory to walk
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            DirEntry for each regular file (or symlink to one)
+        """
+        subdirs: List[str] = []
+        yield from self._walk(root, subdirs=subdirs)
+
+        if not recursive:
+            return
+
+        if self.scan_workers > 1 and len(subdirs) > 4:
+            with ThreadPoolExecutor(max_workers=min(self.scan_workers, len(subdirs))) as executor:
+                yield from chain.from_iterable(
+                    executor.map(lambda subdir: list(self._walk(subdir)), subdirs)
+                )
+        else:
+            for subdir in subdirs:
+                yield from self._walk(subdir)
+
+    def _walk(self, root: str, subdirs: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+        """
+        Serially walk a directory with os.scandir.
+
+        Args:
+            root: Directory to walk
+            subdirs: If given, collect root's subdirectories here instead of
+                descending into them
+
+        Yields:
+            DirEntry for each regular file (or symlink to one)
+        """
+        pending = [root]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            (subdirs if subdirs is not None else pending).append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                self.logger.warning(f"Could not scan directory: {current}", error=str(e))
+
+    def _get_supported_extensions(self) -> FrozenSet[str]:
+        """Get set of all supported file extensions."""
+        return self._supported_extensions
 
     def build_processing_queue(
         self, directories: List[Path], priority: str = "oldest_first", max_size: Optional[int] = None
@@ -112,68 +262,91 @@ class FileManager:
             Ordered list of file paths
         """
         self.logger.info(f"Building processing queue from {len(directories)} directories", priority=priority)
+        self.reused_outputs = []
 
-        # Collect all files
-        all_files = []
-        for directory in directories:
+        # Collect all files (roots are scanned concurrently)
+        def scan_or_skip(directory: Path) -> List[FileEntry]:
             try:
-                files = self.scan_directory(directory)
-                all_files.extend(files)
+                return self._scan_entries(directory)
             except FileNotFoundError as e:
                 self.logger.warning(f"Skipping directory: {e}")
+                return []
+
+        if self.scan_workers > 1 and len(directories) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.scan_workers, len(directories))) as executor:
+                all_files = list(chain.from_iterable(executor.map(scan_or_skip, directories)))
+        else:
+            all_files = list(chain.from_iterable(map(scan_or_skip, directories)))
 
         # Filter out already processed files
-        if self.config["processing"].get("skip_existing", True):
+        skip_existing = self.config["processing"].get("skip_existing", True)
+        if skip_existing:
             all_files = self._filter_already_processed(all_files)
 
-        # Apply priority sorting
+        # Apply priority sorting (stat results were captured during the scan)
         if priority == "oldest_first":
-            all_files.sort(key=lambda p: p.stat().st_mtime)
+            all_files.sort(key=lambda e: e.stat.st_mtime)
         elif priority == "newest_first":
-            all_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+            all_files.sort(key=lambda e: e.stat.st_mtime, reverse=True)
         elif priority == "largest_first":
-            all_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+            all_files.sort(key=lambda e: e.stat.st_size, reverse=True)
 
-        # Apply max size limit
-        if max_size:
+        # Apply max size limit (duplicate lookups read file contents, so they
+        # run only until the queue is full)
+        if skip_existing and self.content_dedup:
+            all_files = self._take_unique_content(all_files, max_size)
+        elif max_size:
             all_files = all_files[:max_size]
 
         self.logger.info(f"Processing queue built: {len(all_files)} files", queue_size=len(all_files))
-        return all_files
+        return [file_entry.path for file_entry in all_files]
 
-    def _filter_already_processed(self, files: List[Path]) -> List[Path]:
+    def _filter_already_processed(self, files: List[FileEntry]) -> List[FileEntry]:
         """
         Filter out files that have already been processed.
 
         Args:
-            files: List of input files
+            files: List of input file entries
 
         Returns:
-            List of unprocessed files
+            List of unprocessed file entries
         """
         unprocessed = []
+        check_timestamp = self.config["processing"].get("check_timestamp", True)
+
+        # Generate expected output paths, then list each output directory once
+        # instead of calling exists()/stat() per file
+        planned = [(file_entry, self._generate_output_path(file_entry.path)) for file_entry in files]
+
+        existing_outputs: Dict[Path, Dict[str, os.DirEntry]] = {}
+        for output_dir in {output_path.parent for _, output_path in planned}:
+            try:
+                with os.scandir(output_dir) as entries:
+                    existing_outputs[output_dir] = {entry.name: entry for entry in entries}
+            except FileNotFoundError:
+                existing_outputs[output_dir] = {}
 
-        for file_path in files:
-            # Generate expected output path
-            output_path = self._generate_output_path(file_path)
+        for file_entry, output_path in planned:
+            file_path = file_entry.path
+            output_entry = existing_outputs[output_path.parent].get(output_path.name)
 
             # Check if output exists
-            if output_path.exists():
+            if output_entry is not None:
                 # Check timestamps if configured
-                if self.config["processing"].get("check_timestamp", True):
-                    input_mtime = file_path.stat().st_mtime
-                    output_mtime = output_path.stat().st_mtime
+                if check_timestamp:
+                    input_mtime = file_entry.stat.st_mtime
+                    output_mtime = output_entry.stat().st_mtime
 
                     # Re-process if input is newer
                     if input_mtime > output_mtime:
-                        self.logger.debug(f"Input newer than output, re-processing: {file_path}")
-                        unprocessed.append(file_path)
+                        self.logger.debug("Input newer than output, re-processing: %s", file_path)
+                        unprocessed.append(file_entry)
                     else:
-                        self.logger.debug(f"Skipping already processed: {file_path}")
+                        self.logger.debug("Skipping already processed: %s", file_path)
                 else:
-                    self.logger.debug(f"Skipping existing output: {file_path}")
+                    self.logger.debug("Skipping existing output: %s", file_path)
             else:
-                unprocessed.append(file_path)
+                unprocessed.append(file_entry)
 
         removed_count = len(files) - len(unprocessed)
         if removed_count > 0:
@@ -181,6 +354,40 @@ class FileManager:
 
         return unprocessed
 
+    def _take_unique_content(self, files: List[FileEntry], max_size: Optional[int]) -> List[FileEntry]:
+        """
+        Take files from a sorted queue, reusing results for duplicate content.
+
+        Duplicates get an existing enhanced result copied to their output path
+        and are listed in reused_outputs instead of being queued.
+
+        Args:
+            files: Prioritized input file entries
+            max_size: Stop once this many files are queued (None for unlimited)
+
+        Returns:
+            File entries still to be processed
+        """
+        queue = []
+        for file_entry in files:
+            if max_size and len(queue) >= max_size:
+                break
+
+            output_path = self._generate_output_path(file_entry.path)
+            if self._reuse_duplicate_output(file_entry, output_path):
+                self.logger.debug("Skipping duplicate content: %s", file_entry.path)
+                self.reused_outputs.append((file_entry.path, output_path))
+            else:
+                queue.append(file_entry)
+
+        if self.reused_outputs:
+            self.logger.info(
+                f"Reused enhanced output for {len(self.reused_outputs)} duplicate files",
+                reused=len(self.reused_outputs)
+            )
+
+        return queue
+
     def _generate_output_path(self, input_path: Path) -> Path:
         """
         Generate output path for enhanced image.
@@ -193,36 +400,37 @@ class FileManager:
         Returns:
             Output path for enhanced image
         """
-        replace_with_enhanced = self.config["processing"].get("replace_with_enhanced", False)
-
-        if replace_with_enhanced:
+        if self._replace_with_enhanced:
             # Create temp file that will replace the original
             temp_dir = Path(self.paths["temp"])
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_output_dir(temp_dir)
 
-            # Use same filename as input (will replace original location)
-            output_filename = input_path.name
-            output_path = temp_dir / f"enhanced_{input_path.name}"
+            # Keep the input's filename (it will replace the original), prefixed
+            # with a digest of its directory: same-named images from different
+            # folders (IMG_0001.jpg) can be in flight at once on a process pool
+            dir_digest = hashlib.sha1(str(input_path.resolve().parent).encode()).hexdigest()[:12]
+            output_path = temp_dir / f"enhanced_{dir_digest}_{input_path.name}"
 
             return output_path
         else:
             # Original behavior: create in separate enhanced/ directory
             input_str = str(input_path.resolve())
-            enhanced_base = Path(self.paths["enhanced"])
-
-            # Preserve directory structure relative to source
-            if self.paths.get("incoming") and str(Path(self.paths["incoming"]).resolve()) in input_str:
-                relative_path = input_path.relative_to(Path(self.paths["incoming"]).resolve())
-                output_dir = enhanced_base / "incoming" / relative_path.parent
-            elif self.paths.get("archive") and str(Path(self.paths["archive"]).resolve()) in input_str:
-                relative_path = input_path.relative_to(Path(self.paths["archive"]).resolve())
-                output_dir = enhanced_base / "archive" / relative_path.parent
+            enhanced_base = self._enhanced_base
+
+            # Preserve directory structure relative to source (prefixes end in a
+            # separator, so "incoming2/" does not match "incoming/")
+            if self._incoming_prefix and input_str.startswith(self._incoming_prefix):
+                relative_dir = os.path.dirname(input_str[len(self._incoming_prefix):])
+                output_dir = enhanced_base / "incoming" / relative_dir
+            elif self._archive_prefix and input_str.startswith(self._archive_prefix):
+                relative_dir = os.path.dirname(input_str[len(self._archive_prefix):])
+                output_dir = enhanced_base / "archive" / relative_dir
             else:
                 # Fallback: use same relative structure
                 output_dir = enhanced_base / input_path.parent.name
 
             # Create output directory
-            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_output_dir(output_dir)
 
             # Generate output filename (add _enhanced suffix)
             stem = input_path.stem
@@ -230,6 +438,179 @@ class FileManager:
 
         return output_dir / output_filename
 
+    def _ensure_output_dir(self, output_dir: Path) -> None:
+        """
+        Create an output directory unless it was already created this run.
+
+        Args:
+            output_dir: Directory to create
+        """
+        if output_dir not in self._known_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(output_dir)
+
+    def _fingerprint(self, file_path: Path, size: int) -> str:
+        """
+        Compute a cheap content fingerprint from size plus first/last 64 KiB.
+
+        Args:
+            file_path: File to fingerprint
+            size: File size in bytes
+
+        Returns:
+            Hex-encoded fingerprint
+        """
+        block = 64 * 1024
+        digest = hashlib.sha256(str(size).encode())
+
+        with open(file_path, "rb") as f:
+            digest.update(f.read(block))
+            if size > block:
+                f.seek(max(block, size - block))
+                digest.update(f.read())
+
+        return digest.hexdigest()
+
+    def _content_index(self) -> sqlite3.Connection:
+        """Get the content-hash index connection, opening (and creating) it on first use."""
+        if self._content_conn is None:
+            self._content_db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._content_db_path)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS content_hashes (
+                    fingerprint TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    PRIMARY KEY (fingerprint, sha256)
+                )
+            """)
+            self._content_conn = conn
+        return self._content_conn
+
+    def close(self) -> None:
+        """Close the content-hash index connection (it reopens on next use)."""
+        if self._content_conn is not None:
+            self._content_conn.close()
+            self._content_conn = None
+
+    def _reuse_duplicate_output(self, file_entry: FileEntry, output_path: Path) -> bool:
+        """
+        Copy an existing enhanced result if identical content was processed before.
+
+        The cheap fingerprint is checked against an in-memory set first; only
+        on a hit is the full SHA-256 computed and compared.
+
+        Args:
+            file_entry: Input file entry (with scan-time stat)
+            output_path: Expected output path for this input
+
+        Returns:
+            True if an existing result was copied to output_path
+        """
+        try:
+            if self._known_fingerprints is None:
+                with self._content_index() as conn:
+                    self._known_fingerprints = {
+                        row[0] for row in conn.execute("SELECT fingerprint FROM content_hashes")
+                    }
+
+            # Nothing recorded yet, so nothing can match
+            if not self._known_fingerprints:
+                return False
+
+            fingerprint = self._fingerprint(file_entry.path, file_entry.stat.st_size)
+            if fingerprint not in self._known_fingerprints:
+                return False
+
+            with self._content_index() as conn:
+                matches = conn.execute(
+                    "SELECT sha256, output_path FROM content_hashes WHERE fingerprint = ?",
+                    (fingerprint,),
+                ).fetchall()
+
+            content_hash = self._hash_file(file_entry.path)
+            for sha256, previous_output in matches:
+                if sha256 != content_hash or previous_output == str(output_path):
+                    continue
+                if not os.path.exists(previous_output):
+                    continue
+
+                # shutil.copy keeps permissions but gives the copy a fresh mtime,
+                # so the timestamp check treats it as up to date
+                if self.safe_write(previous_output, output_path, lambda temp_path, source: shutil.copy(source, temp_path)):
+                    self.logger.info(
+                        f"Reused enhanced output for duplicate content: {file_entry.path}",
+                        source=previous_output,
+                    )
+                    return True
+
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"Content dedup lookup failed: {file_entry.path}", error=str(e))
+
+        return False
+
+    def record_content_hash(self, input_path: Path, output_path: Path) -> None:
+        """
+        Remember which enhanced output was produced for an input's content.
+
+        Args:
+            input_path: Original image (before it is moved)
+            output_path: Enhanced image written for it
+        """
+        if not self.content_dedup:
+            return
+
+        try:
+            fingerprint = self._fingerprint(input_path, input_path.stat().st_size)
+            content_hash = self._hash_file(input_path)
+
+            # The connection stays open; "with" only commits the insert
+            with self._content_index() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO content_hashes (fingerprint, sha256, output_path) VALUES (?, ?, ?)",
+                    (fingerprint, content_hash, str(output_path)),
+                )
+
+            if self._known_fingerprints is not None:
+                self._known_fingerprints.add(fingerprint)
+
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"Could not record content hash: {input_path}", error=str(e))
+
+    def _hash_file(self, file_path: Path) -> str:
+        """
+        Compute the SHA-256 digest of a file's contents.
+
+        Uses hashlib.file_digest (Python 3.11+), which feeds OpenSSL from a
+        reused buffer. Older Pythons hash an mmap of the file in 1 MiB slices
+        so no per-chunk bytes objects are allocated.
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            Hex-encoded SHA-256 digest
+        """
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            digest = hashlib.sha256()
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return digest.hexdigest()  # mmap cannot map empty files
+
+            chunk_size = 1024 * 1024
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        digest.update(view[offset:offset + chunk_size])
+                finally:
+                    view.release()
+
+            return digest.hexdigest()
+
     def validate_file(self, file_path: Path) -> bool:
         """
         Validate that file is processable.
@@ -241,38 +622,58 @@ class FileManager:
             True if file is valid, False otherwise
         """
         try:
-            # Check file exists
-            if not file_path.exists():
+            # Opening the file checks it exists and is readable in one call
+            try:
+                f = open(file_path, "rb")
+            except FileNotFoundError:
                 self.logger.warning(f"File not found: {file_path}")
                 return False
-
-            # Check file is readable
-            if not os.access(file_path, os.R_OK):
+            except PermissionError:
                 self.logger.warning(f"File not readable: {file_path}")
                 return False
 
-            # Check file size (not empty, not too large)
-            file_size = file_path.stat().st_size
-            if file_size == 0:
-                self.logger.warning(f"File is empty: {file_path}")
-                return False
+            with f:
+                # Check file size (not empty)
+                if os.fstat(f.fileno()).st_size == 0:
+                    self.logger.warning(f"File is empty: {file_path}")
+                    return False
 
-            # Check for corruption (basic check - can we open it?)
-            try:
-                from PIL import Image
+                # Check the header looks like an image; the pipeline decodes the
+                # whole file anyway, so a full verify() pass is opt-in
+                header = f.read(12)
 
-                with Image.open(file_path) as img:
-                    img.verify()
-            except Exception as e:
-                self.logger.warning(f"File appears corrupted: {file_path}", error=str(e))
+            if not (header.startswith(IMAGE_SIGNATURES) or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")):
+                self.logger.warning(f"File appears corrupted: {file_path}", error="unrecognized image header")
                 return False
 
+            if self.config["processing"].get("deep_validate", False):
+                try:
+                    from PIL import Image
+
+                    with Image.open(file_path) as img:
+                        img.verify()
+                except Exception as e:
+                    self.logger.warning(f"File appears corrupted: {file_path}", error=str(e))
+                    return False
+
             return True
 
         except Exception as e:
             self.logger.error(f"Error validating file: {file_path}", error=str(e))
             return False
 
+    def validate_batch(self, file_paths: List[Path]) -> List[Path]:
+        """
+        Validate a queue of files up front.
+
+        Args:
+            file_paths: Files to validate
+
+        Returns:
+            The processable files, in their original order
+        """
+        return [file_path for file_path in file_paths if self.validate_file(file_path)]
+
     def safe_write(self, image_data: Any, output_path: Path, write_func) -> bool:
         """
         Safely write file using atomic operation (write to temp, then move).
@@ -289,6 +690,17 @@ class FileManager:
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Linux: stage in an unnamed O_TMPFILE inode when the filesystem supports it
+            temp_fd = self._open_unnamed_temp(output_path.parent)
+            if temp_fd is not None:
+                try:
+                    self._write_unnamed_temp(temp_fd, image_data, output_path, write_func)
+                finally:
+                    os.close(temp_fd)
+
+                self.logger.debug("File safely written: %s", output_path)
+                return True
+
             # Create temporary file in same directory (for atomic move)
             temp_dir = output_path.parent
             temp_fd, temp_path = tempfile.mkstemp(dir=temp_dir, suffix=".tmp")
@@ -303,22 +715,118 @@ class FileManager:
                 if not temp_path.exists() or temp_path.stat().st_size == 0:
                     raise IOError("Write produced empty file")
 
-                # Atomic move to final location
-                shutil.move(str(temp_path), str(output_path))
+                # Atomic rename to final location (temp file is in the same directory)
+                os.replace(temp_path, output_path)
 
-                self.logger.debug(f"File safely written: {output_path}")
+                self.logger.debug("File safely written: %s", output_path)
                 return True
 
             except Exception as e:
                 # Clean up temp file on failure
-                if temp_path.exists():
-                    temp_path.unlink()
+                temp_path.unlink(missing_ok=True)
                 raise e
 
         except Exception as e:
             self.logger.error(f"Failed to write file: {output_path}", error=str(e))
             return False
 
+    def _open_unnamed_temp(self, directory: Path) -> Optional[int]:
+        """
+        Open an unnamed temp file (O_TMPFILE) in directory.
+
+        Args:
+            directory: Directory the file will later be linked into
+
+        Returns:
+            File descriptor, or None if O_TMPFILE is unavailable here
+        """
+        if not hasattr(os, "O_TMPFILE") or not os.path.isdir("/proc/self/fd"):
+            return None
+
+        try:
+            # 0600, the same mode the mkstemp fallback creates files with
+            return os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o600)
+        except OSError:
+            return None  # Filesystem without O_TMPFILE support (e.g. some SMB/NFS mounts)
+
+    def _write_unnamed_temp(self, temp_fd: int, image_data: Any, output_path: Path, write_func) -> None:
+        """
+        Write through an O_TMPFILE descriptor, then link it to output_path.
+
+        The file has no directory entry until it is complete, so a crash
+        mid-write leaves nothing behind, and a new output costs a single
+        link instead of a create plus a rename.
+
+        Args:
+            temp_fd: Descriptor from _open_unnamed_temp
+            image_data: Image data to write
+            output_path: Final output path
+            write_func: Function to perform the actual write (receives temp_path and image_data)
+
+        Raises:
+            IOError: If the write produced an empty file
+        """
+        fd_path = Path(f"/proc/self/fd/{temp_fd}")
+        write_func(fd_path, image_data)
+
+        if os.fstat(temp_fd).st_size == 0:
+            raise IOError("Write produced empty file")
+
+        # os.link() only passes AT_SYMLINK_FOLLOW when a dir_fd is given, so
+        # link "<fd>" relative to /proc/self/fd rather than the full path
+        proc_fd = os.open("/proc/self/fd", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            try:
+                os.link(str(temp_fd), output_path, src_dir_fd=proc_fd)
+            except FileExistsError:
+                # linkat cannot overwrite; link under a temp name and rename over
+                staged_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.{temp_fd}.tmp")
+                os.link(str(temp_fd), staged_path, src_dir_fd=proc_fd)
+                try:
+                    os.replace(staged_path, output_path)
+                except OSError:
+                    staged_path.unlink(missing_ok=True)
+                    raise
+        finally:
+            os.close(proc_fd)
+
+    def readahead(self, file_path: Path) -> None:
+        """
+        Ask the kernel to start reading a file into the page cache.
+
+        Uses posix_fadvise(WILLNEED), which returns without waiting for the
+        read, so the next image's disk I/O overlaps the current enhancement.
+        Does nothing where posix_fadvise is unavailable (e.g. macOS).
+
+        Args:
+            file_path: File that will be read soon
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.debug("Readahead failed: %s", file_path, error=str(e))
+
+    def move_file(self, source: Path, destination: Path) -> None:
+        """
+        Move a file, using a single rename when both paths are on one filesystem.
+
+        Args:
+            source: File to move
+            destination: Target path (replaced if it exists)
+        """
+        try:
+            source.replace(destination)
+        except OSError:
+            # e.g. EXDEV when temp/ and the photo share are different volumes
+            shutil.move(source, destination)
+
     def move_to_originals(self, file_path: Path) -> Optional[Path]:
         """
         Move original file to 'originals' subdirectory.
@@ -342,9 +850,9 @@ class FileManager:
 
             # Move file
             destination = originals_dir / file_path.name
-            shutil.move(str(file_path), str(destination))
+            self.move_file(file_path, destination)
 
-            self.logger.debug(f"Moved to originals: {file_path} -> {destination}")
+            self.logger.debug("Moved to originals: %s -> %s", file_path, destination)
             return destination
 
         except Exception as e:
@@ -375,9 +883,9 @@ class FileManager:
 
             # Preserve relative path structure
             backup_path = backup_dir / file_path.name
-            shutil.copy2(str(file_path), str(backup_path))
+            shutil.copy2(file_path, backup_path)
 
-            self.logger.debug(f"Backup created: {backup_path}")
+            self.logger.debug("Backup created: %s", backup_path)
             return backup_path
 
         except Exception as e:
@@ -388,11 +896,17 @@ class FileManager:
         """
         Check available disk space.
 
+        The underlying statvfs result is cached for DISK_USAGE_TTL_SEC.
+
         Returns:
             Dictionary with disk space information
         """
-        enhanced_path = Path(self.paths["enhanced"])
-        stat = shutil.disk_usage(enhanced_path)
+        now = time.monotonic()
+        if self._disk_usage_cache is not None and now - self._disk_usage_cache[0] < DISK_USAGE_TTL_SEC:
+            stat = self._disk_usage_cache[1]
+        else:
+            stat = shutil.disk_usage(self._enhanced_base)
+            self._disk_usage_cache = (now, stat)
 
         free_gb = stat.free / (1024**3)
         total_gb = stat.total / (1024**3)
@@ -426,17 +940,23 @@ class FileManager:
         Returns:
             Number of files cleaned up
         """
-        temp_dir = Path(self.paths.get("temp", "./temp"))
-        if not temp_dir.exists():
-            return 0
+        temp_dir = self.paths.get("temp", "./temp")
 
         count = 0
-        for temp_file in temp_dir.glob("*.tmp"):
-            try:
-                temp_file.unlink()
-                count += 1
-            except Exception as e:
-                self.logger.debug(f"Could not delete temp file: {temp_file}", error=str(e))
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".tmp"):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except FileNotFoundError:
+                        continue  # Already removed (e.g. by a concurrent run)
+                    except OSError as e:
+                        self.logger.debug("Could not delete temp file: %s", entry.path, error=str(e))
+        except FileNotFoundError:
+            return 0
 
         if count > 0:
             self.logger.info(f"Cleaned up {count} temporary files", count=count)
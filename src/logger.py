@@ -3,15 +3,50 @@ Logging System for Photoner
 Provides structured logging with JSON format, file rotation, and performance tracking.
 """
 
+import atexit
 import logging
 import logging.handlers
 import json
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import threading
 import time
+from collections import deque
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Standard LogRecord attributes; anything else on a record came from extra=
+_LOG_RECORD_RESERVED = frozenset({
+    "name",
+    "msg",
+    "args",
+    "created",
+    "filename",
+    "funcName",
+    "levelname",
+    "levelno",
+    "lineno",
+    "module",
+    "msecs",
+    "message",
+    "pathname",
+    "process",
+    "processName",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+})
 
 
 class JSONFormatter(logging.Formatter):
@@ -34,46 +69,129 @@ class JSONFormatter(logging.Formatter):
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
+            "thread": record.threadName,
         }
 
-        # Add thread information if available
-        if hasattr(record, "threadName"):
-            log_data["thread"] = record.threadName
-
         # Add exception information if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add custom fields from extra parameter
-        for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
-                log_data[key] = value
+        log_data.update({key: value for key, value in record.__dict__.items() if key not in _LOG_RECORD_RESERVED})
 
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process listener.
+
+    The stock prepare() pre-formats the message and drops exc_info so records
+    can be pickled; the listener here runs in the same process, so records are
+    passed through untouched and JSONFormatter still sees exception details.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class DualRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating handler for the main log that also feeds a separate error log.
+
+    Each record is formatted once; ERROR and above are written to both
+    files, each with its own size-based rotation.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        error_filename: Path,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        level: int = logging.NOTSET,
+        encoding: Optional[str] = "utf-8",
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Main log file
+            error_filename: Error log file (ERROR and above)
+            maxBytes: Rotate a file when it would exceed this size (0 = never)
+            backupCount: Rotated files to keep per log
+            level: Minimum level for the main log
+            encoding: File encoding
+        """
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self.error_handler = logging.handlers.RotatingFileHandler(
+            error_filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding
+        )
+        self.main_level = level
+        self.setLevel(min(level, logging.ERROR))
+
+    @staticmethod
+    def _write(handler: logging.handlers.RotatingFileHandler, msg: str) -> None:
+        """Write an already formatted line, rotating first if it would not fit."""
+        if handler.stream is None:
+            handler.stream = handler._open()
+        if handler.maxBytes > 0 and handler.stream.tell() + len(msg) >= handler.maxBytes:
+            handler.doRollover()
+        handler.stream.write(msg)
+        handler.stream.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format the record once and write it to the main and/or error log."""
+        try:
+            msg = self.format(record) + self.terminator
+            if record.levelno >= self.main_level:
+                self._write(self, msg)
+            if record.levelno >= logging.ERROR:
+                self._write(self.error_handler, msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close both log files."""
+        self.error_handler.close()
+        super().close()
+
+
+class _BufferingHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that can also be flushed in order through the log queue.
+
+    Putting flush_request on the listener's queue flushes the buffer after
+    every record queued before it has been handled.
+    """
+
+    def __init__(self, capacity: int, target: logging.Handler):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.setLevel(target.level)
+        self.flush_request = logging.makeLogRecord({"levelno": logging.CRITICAL, "msg": "flush"})
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if record is self.flush_request:
+            self.flush()
+            return True
+        return super().handle(record)
+
+
+class _ReplayHandler(logging.Handler):
+    """Hands records received from worker processes to a local logger."""
+
+    def __init__(self, target: logging.Logger):
+        super().__init__()
+        self.target = target
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.target.handle(record)
+
+
 class PhotonerLogger:
     """
     Centralized logging system for Photoner with support for:
@@ -84,13 +202,15 @@ class PhotonerLogger:
     - Daily summary reports
     """
 
-    def __init__(self, config: Dict[str, Any], name: str = "photoner"):
+    def __init__(self, config: Dict[str, Any], name: str = "photoner", log_queue: Optional[Any] = None):
         """
         Initialize the logging system.
 
         Args:
             config: Configuration dictionary from config.yaml
             name: Logger name (default: "photoner")
+            log_queue: If given (in a worker process), send records to this
+                multiprocessing queue instead of setting up handlers
         """
         self.config = config
         self.logger = logging.getLogger(name)
@@ -100,18 +220,22 @@ class PhotonerLogger:
         if self.logger.handlers:
             self.logger.handlers.clear()
 
-        # Performance tracking
+        # Performance tracking. Per-image counters live in per-thread dicts so
+        # workers never contend on a lock; end_batch() sums them.
         self.metrics = {
-            "images_processed": 0,
-            "images_failed": 0,
-            "total_processing_time": 0.0,
             "batch_start_time": None,
-            "errors": [],
+            "errors": deque(maxlen=1000),
         }
         self.metrics_lock = threading.Lock()
+        self._thread_counters = threading.local()
+        self._counter_registry: List[Dict[str, Any]] = []
+        self._file_buffer: Optional[_BufferingHandler] = None
 
-        # Set up logging handlers
-        self._setup_handlers()
+        # Set up logging handlers (workers forward to the parent's listener)
+        if log_queue is not None:
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        else:
+            self._setup_handlers()
 
     def _setup_handlers(self) -> None:
         """Configure console and file logging handlers."""
@@ -140,10 +264,15 @@ class PhotonerLogger:
             max_bytes = log_config.get("max_log_size_mb", 100) * 1024 * 1024
             backup_count = log_config.get("backup_count", 5)
 
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file, maxBytes=max_bytes, backupCount=backup_count
+            # Main log plus a separate error log, from a single formatting pass
+            error_log_file = log_dir / "errors.log"
+            file_handler = DualRotatingFileHandler(
+                log_file,
+                error_log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                level=getattr(logging, log_config.get("file_level", "DEBUG")),
             )
-            file_handler.setLevel(getattr(logging, log_config.get("file_level", "DEBUG")))
 
             if log_config.get("json_format", True):
                 file_handler.setFormatter(JSONFormatter())
@@ -151,24 +280,69 @@ class PhotonerLogger:
                 file_format = "%(asctime)s [%(levelname)s] [%(threadName)s] %(message)s"
                 file_handler.setFormatter(logging.Formatter(file_format))
 
-            self.logger.addHandler(file_handler)
-
-            # Separate error log file
-            error_log_file = log_dir / "errors.log"
-            error_handler = logging.handlers.RotatingFileHandler(
-                error_log_file, maxBytes=max_bytes, backupCount=backup_count
+            # Buffer records and write them in bursts; errors flush immediately
+            file_target = file_handler
+            buffer_capacity = log_config.get("buffer_capacity", 256)
+            if buffer_capacity > 0:
+                self._file_buffer = _BufferingHandler(buffer_capacity, file_handler)
+                file_target = self._file_buffer
+
+            # Format and write file logs on a background thread; callers only enqueue
+            self._log_queue = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(
+                self._log_queue, file_target, respect_handler_level=True
             )
-            error_handler.setLevel(logging.ERROR)
-            error_handler.setFormatter(JSONFormatter() if log_config.get("json_format", True) else logging.Formatter(file_format))
-            self.logger.addHandler(error_handler)
+            self._listener.start()
+            atexit.register(self._listener.stop)
 
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message."""
-        self.logger.debug(message, extra=kwargs)
+            self.logger.addHandler(_LocalQueueHandler(self._log_queue))
 
-    def info(self, message: str, **kwargs) -> None:
-        """Log info message."""
-        self.logger.info(message, extra=kwargs)
+    def listen(self, log_queue: Any) -> logging.handlers.QueueListener:
+        """
+        Start replaying records from worker processes through this logger.
+
+        Args:
+            log_queue: multiprocessing queue that workers' loggers write to
+
+        Returns:
+            Started QueueListener (caller stops it when the workers are done)
+        """
+        listener = logging.handlers.QueueListener(log_queue, _ReplayHandler(self.logger))
+        listener.start()
+        return listener
+
+    def _counters(self) -> Dict[str, Any]:
+        """Return the calling thread's counters for the current batch."""
+        counters = getattr(self._thread_counters, "counters", None)
+        if counters is None:
+            counters = {"images_processed": 0, "images_failed": 0, "total_processing_time": 0.0}
+            self._thread_counters.counters = counters
+            with self.metrics_lock:
+                self._counter_registry.append(counters)
+        return counters
+
+    def _sum_counters(self) -> Dict[str, Any]:
+        """Total the per-thread counters (caller holds metrics_lock)."""
+        totals = {"images_processed": 0, "images_failed": 0, "total_processing_time": 0.0}
+        for counters in self._counter_registry:
+            for key in totals:
+                totals[key] += counters[key]
+        return totals
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """
+        Log debug message.
+
+        Pass values as %-style args (not an f-string) on hot paths so the
+        message is only formatted when DEBUG is enabled.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(message, *args, extra=kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        """Log info message (%-style args are formatted only if emitted)."""
+        self.logger.info(message, *args, extra=kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
@@ -216,9 +390,9 @@ class PhotonerLogger:
         """
         processing_time = time.time() - start_time
 
-        with self.metrics_lock:
-            self.metrics["images_processed"] += 1
-            self.metrics["total_processing_time"] += processing_time
+        counters = self._counters()
+        counters["images_processed"] += 1
+        counters["total_processing_time"] += processing_time
 
         log_data = {
             "input_file": str(image_path),
@@ -241,8 +415,7 @@ class PhotonerLogger:
             error: The exception that occurred
             start_time: Processing start time (optional)
         """
-        with self.metrics_lock:
-            self.metrics["images_failed"] += 1
+        self._counters()["images_failed"] += 1
 
         log_data = {
             "input_file": str(image_path),
@@ -278,17 +451,18 @@ class PhotonerLogger:
         """
         with self.metrics_lock:
             batch_time = time.time() - self.metrics["batch_start_time"] if self.metrics["batch_start_time"] else 0
-            total_images = self.metrics["images_processed"] + self.metrics["images_failed"]
+            totals = self._sum_counters()
+            total_images = totals["images_processed"] + totals["images_failed"]
 
             metrics = {
                 "total_images": total_images,
-                "successful": self.metrics["images_processed"],
-                "failed": self.metrics["images_failed"],
-                "error_rate": (self.metrics["images_failed"] / total_images * 100) if total_images > 0 else 0,
+                "successful": totals["images_processed"],
+                "failed": totals["images_failed"],
+                "error_rate": (totals["images_failed"] / total_images * 100) if total_images > 0 else 0,
                 "batch_time_sec": round(batch_time, 2),
                 "avg_time_per_image": (
-                    round(self.metrics["total_processing_time"] / self.metrics["images_processed"], 2)
-                    if self.metrics["images_processed"] > 0
+                    round(totals["total_processing_time"] / totals["images_processed"], 2)
+                    if totals["images_processed"] > 0
                     else 0
                 ),
                 "throughput_images_per_hour": (
@@ -296,16 +470,21 @@ class PhotonerLogger:
                 ),
             }
 
-            # Reset metrics for next batch
+            # Reset metrics for next batch (a fresh thread-local gives every
+            # thread new counters on its next update)
             self.metrics = {
-                "images_processed": 0,
-                "images_failed": 0,
-                "total_processing_time": 0.0,
                 "batch_start_time": None,
-                "errors": [],
+                "errors": deque(maxlen=1000),
             }
+            self._thread_counters = threading.local()
+            self._counter_registry = []
 
         self.info("Batch processing complete", **metrics)
+
+        # Write out buffered file records at the batch boundary
+        if self._file_buffer is not None:
+            self._log_queue.put(self._file_buffer.flush_request)
+
         return metrics
 
     def generate_summary_report(self, output_file: Optional[Path] = None) -> Dict[str, Any]:
@@ -319,11 +498,12 @@ class PhotonerLogger:
             Dictionary containing summary report
         """
         with self.metrics_lock:
+            totals = self._sum_counters()
             report = {
                 "timestamp": datetime.utcnow().isoformat() + "Z",
-                "images_processed": self.metrics["images_processed"],
-                "images_failed": self.metrics["images_failed"],
-                "recent_errors": self.metrics["errors"][-10:],  # Last 10 errors
+                "images_processed": totals["images_processed"],
+                "images_failed": totals["images_failed"],
+                "recent_errors": list(self.metrics["errors"])[-10:],  # Last 10 errors
             }
 
         if output_file:
@@ -335,15 +515,16 @@ class PhotonerLogger:
         return report
 
 
-def setup_logger(config: Dict[str, Any], name: str = "photoner") -> PhotonerLogger:
+def setup_logger(config: Dict[str, Any], name: str = "photoner", log_queue: Optional[Any] = None) -> PhotonerLogger:
     """
     Factory function to create and configure logger.
 
     Args:
         config: Configuration dictionary from config.yaml
         name: Logger name
+        log_queue: Queue to forward records to (worker processes only)
 
     Returns:
         Configured PhotonerLogger instance
     """
-    return PhotonerLogger(config, name)
+    return PhotonerLogger(config, name, log_queue)
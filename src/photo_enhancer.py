@@ -6,19 +6,87 @@ batch processing, error handling, and crash recovery.
 
 import sys
 import argparse
-import shutil
+import copy
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import cv2
 import yaml
 import time
 from datetime import datetime
 
+# libyaml's C loader when available (same result, much faster parse)
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 # Import our modules
 from logger import setup_logger
 from processor import ImageProcessor
 from file_manager import FileManager
 
 
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, memoized on path and modification time.
+
+    Callers must deep-copy the result before mutating it.
+
+    Args:
+        config_path: Path to the config file
+        mtime_ns: File modification time (part of the cache key only)
+
+    Returns:
+        Parsed configuration dictionary (shared; do not mutate)
+    """
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAMLLoader)
+
+
+# ImageProcessor for this worker process (set up once by _init_worker)
+_worker_processor: Optional[ImageProcessor] = None
+
+
+def _init_worker(config: Dict[str, Any], log_queue: Any, opencv_threads: int) -> None:
+    """
+    Initialize a process-pool worker.
+
+    Args:
+        config: Configuration dictionary (profile already applied)
+        log_queue: Queue the parent replays worker log records from
+        opencv_threads: Threads OpenCV may use inside this worker
+    """
+    global _worker_processor
+    # Workers already run side by side; keep OpenCV's own thread pool from
+    # oversubscribing the cores
+    cv2.setNumThreads(opencv_threads)
+    _worker_processor = ImageProcessor(config, setup_logger(config, log_queue=log_queue))
+
+
+def _process_one(image_path: Path, output_path: Path, delay: float = 0.0) -> Tuple[Dict[str, Any], float]:
+    """
+    Enhance one image in a worker process.
+
+    Args:
+        image_path: Input image path
+        output_path: Output path for the enhanced image
+        delay: Seconds to wait first (used when retrying a failed image)
+
+    Returns:
+        Tuple of (processing result, processing time in seconds)
+    """
+    if delay:
+        time.sleep(delay)
+    start_time = _worker_processor.logger.log_processing_start(str(image_path))
+    result = _worker_processor.process_image(image_path, output_path)
+    return result, time.time() - start_time
+
+
 class PhotoEnhancer:
     """
     Main orchestrator for the photo enhancement system.
@@ -41,11 +109,24 @@ class PhotoEnhancer:
         self.logger.info("Photoner - Automated Photo Enhancement System")
         self.logger.info("=" * 80)
         self.logger.info(f"Configuration loaded from: {config_path}")
+        self.logger.debug("YAML loader: %s", _YAMLLoader.__name__)
 
         # Initialize components
         self.file_manager = FileManager(self.config, self.logger)
         self.processor = ImageProcessor(self.config, self.logger)
 
+        # Per-image settings, read once rather than on every image
+        processing_config = self.config["processing"]
+        self._create_backups = processing_config.get("create_backups", False)
+        self._replace_with_enhanced = processing_config.get("replace_with_enhanced", False)
+        self._move_originals = processing_config.get("move_processed_originals", False)
+        self._retry_failed = self.config["error_handling"].get("retry_failed_images", False)
+        self._retry_delay = self.config["error_handling"].get("retry_delay_seconds", 0)
+        self._readahead = self.config["advanced"].get("readahead_next_image", True)
+
+        # Input directories per mode, resolved on first use
+        self._input_dirs: Dict[str, List[Path]] = {}
+
         # Processing statistics
         self.stats = {
             "session_start": datetime.utcnow().isoformat(),
@@ -68,11 +149,13 @@ class PhotoEnhancer:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Copy so profile overrides etc. never leak into the cached parse
+        config = copy.deepcopy(_parse_config(str(config_path), mtime_ns))
 
         # Validate critical configuration
         required_sections = ["paths", "processing", "enhancement", "logging"]
@@ -124,12 +207,16 @@ class PhotoEnhancer:
             max_size=max_batch_size
         )
 
-        if not queue:
+        # Duplicates whose enhanced result was copied while building the queue
+        reused = self.file_manager.reused_outputs
+
+        if not queue and not reused:
+            self.file_manager.close()
             self.logger.info("No images to process")
             return {"total_images": 0, "message": "No images found"}
 
         # Start batch processing
-        self.logger.start_batch(len(queue), mode)
+        self.logger.start_batch(len(queue) + len(reused), mode)
 
         # Process each image
         results = {
@@ -138,74 +225,81 @@ class PhotoEnhancer:
             "skipped": [],
         }
 
-        consecutive_failures = 0
-        max_consecutive = self.config["error_handling"]["max_consecutive_failures"]
-
-        for i, image_path in enumerate(queue, 1):
-            self.logger.info(f"Processing image {i}/{len(queue)}: {image_path.name}")
+        # Reused duplicates need the same file handling as processed images
+        for image_path, output_path in reused:
+            self._finish_image(image_path, output_path, {}, time.time(), results, record_hash=False)
 
-            try:
-                # Validate file
-                if not self.file_manager.validate_file(image_path):
+        # Validate the whole queue up front so the loops only see processable files
+        valid_queue = self.file_manager.validate_batch(queue)
+        if len(valid_queue) < len(queue):
+            valid = set(valid_queue)
+            for image_path in queue:
+                if image_path not in valid:
                     self.logger.warning(f"Skipping invalid file: {image_path}")
                     results["skipped"].append(str(image_path))
                     self.stats["total_skipped"] += 1
-                    continue
+            queue = valid_queue
 
-                # Create backup if enabled
-                if self.config["processing"].get("create_backups", False):
-                    self.file_manager.create_backup(image_path)
+        # Multi-core processing is opt-in (advanced.use_multiprocessing)
+        workers = self.config["processing"].get("processing_threads", 1)
+        if self.config["advanced"].get("use_multiprocessing", False) and workers > 1 and len(queue) > 1:
+            self._process_parallel(queue, results, min(workers, len(queue)))
+        else:
+            self._process_serial(queue, results)
 
-                # Generate output path
-                output_path = self.file_manager._generate_output_path(image_path)
+        # End batch and get metrics
+        batch_metrics = self.logger.end_batch()
+
+        # Clean up temp files
+        self.file_manager.cleanup_temp_files()
+        self.file_manager.close()
+
+        # Combine results
+        final_results = {
+            **results,
+            "metrics": batch_metrics,
+            "stats": self.stats,
+        }
+
+        self.logger.info("Batch processing complete", **batch_metrics)
+        return final_results
+
+    def _process_serial(self, queue: List[Path], results: Dict[str, List]) -> None:
+        """
+        Process the queue one image at a time in this process.
+
+        Args:
+            queue: Images to process
+            results: Batch results to update
+        """
+        consecutive_failures = 0
+        max_consecutive = self.config["error_handling"]["max_consecutive_failures"]
+
+        total = len(queue)
+        for i, image_path in enumerate(queue, 1):
+            self.logger.info("Processing image %d/%d: %s", i, total, image_path.name)
+
+            # Let the disk read the next image while this one is enhanced
+            if self._readahead and i < total:
+                self.file_manager.readahead(queue[i])
+
+            try:
+                output_path = self._prepare_image(image_path)
 
                 # Process image
                 start_time = self.logger.log_processing_start(str(image_path))
 
                 result = self.processor.process_image(image_path, output_path)
 
-                # Handle file organization based on config
-                final_enhanced_path = output_path
-                if self.config["processing"].get("replace_with_enhanced", False):
-                    # Move original to /originals/ subfolder
-                    originals_path = self.file_manager.move_to_originals(image_path)
-
-                    # Move enhanced image to original location
-                    if originals_path:
-                        final_enhanced_path = originals_path.parent.parent / image_path.name
-                        shutil.move(str(output_path), str(final_enhanced_path))
-                        self.logger.debug(f"Replaced original with enhanced: {final_enhanced_path}")
-                else:
-                    # Original behavior: move to /processed subfolder
-                    if self.config["processing"].get("move_processed_originals", False):
-                        originals_path = self.file_manager.move_to_originals(image_path)
-
-                self.logger.log_processing_complete(
-                    str(image_path),
-                    str(final_enhanced_path),
-                    start_time,
-                    result.get("adjustments")
-                )
-
-                results["successful"].append(str(image_path))
-                self.stats["total_processed"] += 1
+                self._finish_image(image_path, output_path, result, start_time, results)
                 consecutive_failures = 0  # Reset counter
 
             except Exception as e:
-                self.logger.log_processing_error(image_path, e)
-                results["failed"].append({"file": str(image_path), "error": str(e)})
-                self.stats["total_failed"] += 1
-                consecutive_failures += 1
+                if self._handle_failure(image_path, e, results):
+                    consecutive_failures = 0
+                    continue
 
-                # Retry logic if configured
-                if self.config["error_handling"].get("retry_failed_images", False):
-                    if self._retry_processing(image_path):
-                        results["failed"].pop()  # Remove from failed
-                        results["successful"].append(str(image_path))
-                        self.stats["total_failed"] -= 1
-                        self.stats["total_processed"] += 1
-                        consecutive_failures = 0
-                        continue
+                consecutive_failures += 1
 
                 # Check for abort conditions
                 if consecutive_failures >= max_consecutive:
@@ -215,21 +309,236 @@ class PhotoEnhancer:
                     )
                     break
 
-        # End batch and get metrics
-        batch_metrics = self.logger.end_batch()
+    def _process_parallel(self, queue: List[Path], results: Dict[str, List], workers: int) -> None:
+        """
+        Enhance images on a process pool; file handling stays in this process.
 
-        # Clean up temp files
-        self.file_manager.cleanup_temp_files()
+        Backups and output paths are prepared here, workers run
+        ImageProcessor.process_image, and results are finished (moved,
+        logged) here as they complete.
 
-        # Combine results
-        final_results = {
-            **results,
-            "metrics": batch_metrics,
-            "stats": self.stats,
-        }
+        Args:
+            queue: Images to process
+            results: Batch results to update
+            workers: Number of worker processes
+        """
+        consecutive_failures = 0
+        max_consecutive = self.config["error_handling"]["max_consecutive_failures"]
 
-        self.logger.info("Batch processing complete", **batch_metrics)
-        return final_results
+        opencv_threads = max(1, (os.cpu_count() or 1) // workers)
+        log_queue = multiprocessing.Queue()
+        listener = self.logger.listen(log_queue)
+        self.logger.info(f"Processing with {workers} worker processes", workers=workers)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.config, log_queue, opencv_threads)
+            ) as executor:
+                futures = {}
+                submitted_outputs = set()
+                total = len(queue)
+                for i, image_path in enumerate(queue, 1):
+                    self.logger.info("Processing image %d/%d: %s", i, total, image_path.name)
+                    try:
+                        output_path = self._prepare_image(image_path)
+                    except Exception as e:
+                        self._handle_failure(image_path, e, results)
+                        continue
+
+                    # Two in-flight images writing one output would overwrite
+                    # each other's result
+                    if output_path in submitted_outputs:
+                        self.logger.warning(
+                            f"Skipping image with duplicate output path: {image_path}",
+                            output_path=str(output_path)
+                        )
+                        results["skipped"].append(str(image_path))
+                        self.stats["total_skipped"] += 1
+                        continue
+                    submitted_outputs.add(output_path)
+
+                    futures[executor.submit(_process_one, image_path, output_path)] = (image_path, output_path, None)
+
+                # Workers start on the first `workers` images; as each one
+                # finishes, hint the next image a worker will pick up
+                upcoming = [path for path, _, _ in futures.values()][workers:]
+                if self._readahead and upcoming:
+                    self.file_manager.readahead(upcoming.pop(0))
+
+                # Retries go back to the pool (sleeping there first) so this loop
+                # never stalls collecting other results
+                pending = set(futures)
+                aborted = False
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if self._readahead and upcoming:
+                            self.file_manager.readahead(upcoming.pop(0))
+
+                        image_path, output_path, failure = futures.pop(future)
+                        try:
+                            result, processing_time = future.result()
+                            # Processing time was measured in the worker; rebase
+                            # it onto this process's clock
+                            start_time = time.time() - processing_time
+                            self._finish_image(image_path, output_path, result, start_time, results)
+                            if failure is not None:
+                                self._clear_failure(failure, results)
+                                self.logger.info(f"Retry successful: {image_path}")
+                            consecutive_failures = 0
+                            continue
+
+                        except Exception as e:
+                            if failure is None:
+                                failure = self._record_failure(image_path, e, results)
+                                if self._retry_failed and not aborted:
+                                    self.logger.info(f"Retrying: {image_path}")
+                                    retry = executor.submit(_process_one, image_path, output_path, self._retry_delay)
+                                    futures[retry] = (image_path, output_path, failure)
+                                    pending.add(retry)
+                                    continue
+                            else:
+                                self.logger.error(f"Retry failed: {image_path}", error=str(e))
+
+                        if aborted:
+                            continue
+
+                        consecutive_failures += 1
+
+                        # Check for abort conditions (drop images not yet started)
+                        if consecutive_failures >= max_consecutive:
+                            self.logger.critical(
+                                f"Aborting: {consecutive_failures} consecutive failures",
+                                consecutive_failures=consecutive_failures
+                            )
+                            aborted = True
+                            upcoming.clear()
+                            # Images already running still write their outputs;
+                            # keep collecting them so they are finished or
+                            # recorded, not left with the original in place
+                            pending = {remaining for remaining in pending if not remaining.cancel()}
+        finally:
+            listener.stop()
+
+    def _prepare_image(self, image_path: Path) -> Path:
+        """
+        Back up a validated image if configured and pick its output path.
+
+        Args:
+            image_path: Input image path
+
+        Returns:
+            Output path
+        """
+        # Create backup if enabled
+        if self._create_backups:
+            self.file_manager.create_backup(image_path)
+
+        # Generate output path
+        return self.file_manager._generate_output_path(image_path)
+
+    def _finish_image(
+        self,
+        image_path: Path,
+        output_path: Path,
+        result: Dict[str, Any],
+        start_time: float,
+        results: Dict[str, List],
+        record_hash: bool = True
+    ) -> None:
+        """
+        Organize files after an image was enhanced and record the success.
+
+        Args:
+            image_path: Input image path
+            output_path: Where the enhanced image was written
+            result: Result from ImageProcessor.process_image
+            start_time: Processing start time
+            results: Batch results to update
+            record_hash: Remember the image's content for duplicate detection
+        """
+        # Remember this content so byte-identical copies can reuse the result
+        if record_hash:
+            self.file_manager.record_content_hash(image_path, output_path)
+
+        # Handle file organization based on config
+        final_enhanced_path = output_path
+        if self._replace_with_enhanced:
+            # Move original to /originals/ subfolder
+            originals_path = self.file_manager.move_to_originals(image_path)
+
+            # Move enhanced image to original location
+            if originals_path:
+                final_enhanced_path = originals_path.parent.parent / image_path.name
+                self.file_manager.move_file(output_path, final_enhanced_path)
+                self.logger.debug(f"Replaced original with enhanced: {final_enhanced_path}")
+        else:
+            # Original behavior: move to /processed subfolder
+            if self._move_originals:
+                originals_path = self.file_manager.move_to_originals(image_path)
+
+        self.logger.log_processing_complete(
+            str(image_path),
+            str(final_enhanced_path),
+            start_time,
+            result.get("adjustments")
+        )
+
+        results["successful"].append(str(image_path))
+        self.stats["total_processed"] += 1
+
+    def _handle_failure(self, image_path: Path, error: Exception, results: Dict[str, List]) -> bool:
+        """
+        Record a failed image and retry it if configured.
+
+        Args:
+            image_path: Image that failed
+            error: The exception raised
+            results: Batch results to update
+
+        Returns:
+            True if a retry succeeded (the image counts as successful)
+        """
+        failure = self._record_failure(image_path, error, results)
+
+        # Retry logic if configured
+        if self._retry_failed:
+            if self._retry_processing(image_path):
+                self._clear_failure(failure, results)
+                results["successful"].append(str(image_path))
+                self.stats["total_processed"] += 1
+                return True
+
+        return False
+
+    def _record_failure(self, image_path: Path, error: Exception, results: Dict[str, List]) -> Dict[str, str]:
+        """
+        Log a failed image and count it in the batch results.
+
+        Args:
+            image_path: Image that failed
+            error: The exception raised
+            results: Batch results to update
+
+        Returns:
+            The entry added to results["failed"]
+        """
+        self.logger.log_processing_error(image_path, error)
+        failure = {"file": str(image_path), "error": str(error)}
+        results["failed"].append(failure)
+        self.stats["total_failed"] += 1
+        return failure
+
+    def _clear_failure(self, failure: Dict[str, str], results: Dict[str, List]) -> None:
+        """
+        Take back a recorded failure after a successful retry.
+
+        Args:
+            failure: Entry returned by _record_failure
+            results: Batch results to update
+        """
+        results["failed"].remove(failure)
+        self.stats["total_failed"] -= 1
 
     def _get_input_directories(self, mode: str, override_dir: Optional[Path]) -> List[Path]:
         """
@@ -245,20 +554,24 @@ class PhotoEnhancer:
         if override_dir:
             return [override_dir]
 
-        if mode == "incoming":
-            return [Path(self.config["paths"]["incoming"])]
-        elif mode == "archive":
-            return [Path(self.config["paths"]["archive"])]
-        elif mode == "test":
-            # For testing, check both if they exist
-            dirs = []
-            for key in ["incoming", "archive"]:
-                path = Path(self.config["paths"].get(key, ""))
-                if path.exists():
-                    dirs.append(path)
-            return dirs or [Path("./test_samples")]
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
+        if mode not in self._input_dirs:
+            if mode == "incoming":
+                dirs = [Path(self.config["paths"]["incoming"])]
+            elif mode == "archive":
+                dirs = [Path(self.config["paths"]["archive"])]
+            elif mode == "test":
+                # For testing, check both if they exist
+                dirs = []
+                for key in ["incoming", "archive"]:
+                    path = Path(self.config["paths"].get(key, ""))
+                    if path.exists():
+                        dirs.append(path)
+                dirs = dirs or [Path("./test_samples")]
+            else:
+                raise ValueError(f"Unknown mode: {mode}")
+            self._input_dirs[mode] = dirs
+
+        return list(self._input_dirs[mode])
 
     def _retry_processing(self, image_path: Path) -> bool:
         """
@@ -389,8 +702,7 @@ def main():
         # Override profile if specified
         if args.profile:
             enhancer.config["enhancement"]["profile"] = args.profile
-            enhancer.processor.profile = args.profile
-            enhancer.processor._apply_profile()
+            enhancer.processor.set_profile(args.profile)
 
         # Show status and exit
         if args.status:
@@ -8,9 +8,11 @@ import cv2
 import numpy as np
 import piexif
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from PIL import Image
 import io
+import struct
+from datetime import datetime
 
 try:
     import rawpy
@@ -18,6 +20,64 @@ try:
 except ImportError:
     RAWPY_AVAILABLE = False
 
+# The 256 uint8 intensity levels, for building lookup tables
+_LEVELS = np.arange(256, dtype=np.float32)
+
+# Global statistics (gray-world means, brightness percentiles) are estimated
+# from every Nth pixel in each direction; images smaller than this many pixels
+# on a side are measured in full
+_STATS_STRIDE = 4
+_STATS_MIN_SIDE = 512
+
+# Values accepted for enhancement.noise_reduction.algorithm
+_NOISE_REDUCTION_ALGORITHMS = frozenset({"nlm", "bilateral"})
+
+# Largest payload a JPEG marker segment can hold (length field includes itself)
+_MAX_JPEG_SEGMENT = 65533
+
+
+def _stats_sample(image: np.ndarray) -> np.ndarray:
+    """
+    Subsample an image for computing global statistics.
+
+    Args:
+        image: Image or single channel
+
+    Returns:
+        A contiguous grid sample of the image, or the image itself if small
+    """
+    if min(image.shape[:2]) < _STATS_MIN_SIDE:
+        return image
+    return np.ascontiguousarray(image[::_STATS_STRIDE, ::_STATS_STRIDE])
+
+
+def _insert_exif_segment(jpeg: bytes, exif: bytes) -> bytes:
+    """
+    Insert EXIF bytes into an encoded JPEG as an APP1 segment.
+
+    The segment goes after the JFIF APP0 header when there is one, which is
+    where libjpeg (and so Pillow) writes it.
+
+    Args:
+        jpeg: Encoded JPEG bytes
+        exif: EXIF payload, including its "Exif" header
+
+    Returns:
+        JPEG bytes with the EXIF segment
+
+    Raises:
+        ValueError: If the EXIF payload does not fit in one segment
+    """
+    if len(exif) > _MAX_JPEG_SEGMENT:
+        raise ValueError("EXIF data is too long")
+
+    position = 2  # After SOI
+    if jpeg[2:4] == b"\xff\xe0":
+        position += 2 + struct.unpack(">H", jpeg[4:6])[0]
+
+    segment = b"\xff\xe1" + struct.pack(">H", len(exif) + 2) + exif
+    return jpeg[:position] + segment + jpeg[position:]
+
 
 class ImageProcessor:
     """
@@ -36,11 +96,38 @@ class ImageProcessor:
         self.config = config
         self.logger = logger
         self.enhancement_config = config["enhancement"]
-        self.profile = config["enhancement"]["profile"]
 
         # Apply profile presets
+        self.set_profile(config["enhancement"]["profile"])
+
+    def set_profile(self, profile: str) -> None:
+        """
+        Switch enhancement profile and rebuild the state derived from it.
+
+        Args:
+            profile: Name of a profile under the config's "profiles" section
+        """
+        self.profile = profile
         self._apply_profile()
 
+        # CLAHE settings are fixed once the profile is applied, so build it here
+        # rather than per image
+        clahe_config = self.enhancement_config["clahe"]
+        self._clahe = cv2.createCLAHE(
+            clipLimit=clahe_config["clip_limit"],
+            tileGridSize=(clahe_config["tile_grid_size"], clahe_config["tile_grid_size"]),
+        )
+
+        # Resolve the denoiser once, so the recorded algorithm is the one that runs
+        algorithm = self.enhancement_config["noise_reduction"].get("algorithm", "nlm")
+        if algorithm not in _NOISE_REDUCTION_ALGORITHMS:
+            self.logger.warning(f"Unknown noise reduction algorithm '{algorithm}', using nlm", algorithm=algorithm)
+            algorithm = "nlm"
+        self._noise_algorithm = algorithm
+
+        # Enabled stages are known once the profile is applied
+        self._stages = self._build_stages()
+
     def _apply_profile(self) -> None:
         """Apply enhancement profile presets to override default settings."""
         profiles = self.config.get("profiles", {})
@@ -64,6 +151,38 @@ class ImageProcessor:
             if "white_balance_enabled" in profile_settings:
                 self.enhancement_config["white_balance"]["enabled"] = profile_settings["white_balance_enabled"]
 
+    def _build_stages(self) -> List[Callable[[np.ndarray, Dict[str, Any]], np.ndarray]]:
+        """
+        Build the ordered list of enabled enhancement stages.
+
+        Returns:
+            Stage methods, each taking (image, adjustments) and returning the new image
+        """
+        config = self.enhancement_config
+        stages = []
+
+        # 1. CLAHE - Contrast enhancement
+        if config["clahe"]["enabled"]:
+            stages.append(self._apply_clahe)
+
+        # 2. White balance correction
+        if config["white_balance"]["enabled"]:
+            stages.append(self._apply_white_balance)
+
+        # 3-4. Brightness/Exposure correction and saturation enhancement
+        if config["brightness"]["enabled"] or config["saturation"]["enabled"]:
+            stages.append(self._apply_hsv_stage)
+
+        # 5. Noise reduction (conditional on ISO, checked per image)
+        if config["noise_reduction"]["enabled"]:
+            stages.append(self._apply_noise_reduction)
+
+        # 6. Sharpening (last step)
+        if config["sharpening"]["enabled"]:
+            stages.append(self._apply_sharpening)
+
+        return stages
+
     def process_image(self, input_path: Path, output_path: Path) -> Dict[str, Any]:
         """
         Main entry point for processing an image.
@@ -92,8 +211,11 @@ class ImageProcessor:
         # Track adjustments made
         adjustments = {}
 
+        # Parse EXIF once; it is needed for ISO detection and again on save
+        exif_dict = self._parse_exif(exif_data, input_path)
+
         # Apply enhancement pipeline
-        enhanced_image = self._apply_enhancement_pipeline(image_bgr, exif_data, adjustments)
+        enhanced_image = self._apply_enhancement_pipeline(image_bgr, exif_dict, adjustments)
 
         # Verify dimensions unchanged (as per requirement)
         if enhanced_image.shape[:2] != (original_height, original_width):
@@ -103,7 +225,7 @@ class ImageProcessor:
             )
 
         # Save enhanced image with EXIF preservation
-        self._save_image_with_exif(enhanced_image, output_path, exif_data)
+        self._save_image_with_exif(enhanced_image, output_path, exif_data, exif_dict)
 
         return {
             "input_path": str(input_path),
@@ -143,16 +265,13 @@ class ImageProcessor:
                 rgb = raw.postprocess(
                     use_camera_wb=True,
                     use_auto_wb=False,
-                    output_bps=16,  # 16-bit processing for quality
+                    output_bps=8,  # Pipeline is 8-bit; let libraw reduce precision
                     no_auto_bright=True,  # We'll handle brightness ourselves
                 )
 
             # Convert RGB to BGR for OpenCV
             bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
 
-            # Convert from 16-bit to 8-bit
-            bgr = (bgr / 256).astype(np.uint8)
-
             # Try to extract EXIF from RAW (may not be available)
             exif_data = None
             try:
@@ -196,46 +315,30 @@ class ImageProcessor:
         return image_bgr, exif_data
 
     def _apply_enhancement_pipeline(
-        self, image: np.ndarray, exif_data: Optional[bytes], adjustments: Dict[str, Any]
+        self, image: np.ndarray, exif_dict: Optional[Dict[str, Any]], adjustments: Dict[str, Any]
     ) -> np.ndarray:
         """
         Apply full enhancement pipeline to image.
 
         Args:
             image: Input image in BGR format
-            exif_data: EXIF metadata (used for ISO detection)
+            exif_dict: Parsed EXIF metadata (used for ISO detection)
             adjustments: Dictionary to store adjustment metrics
 
         Returns:
             Enhanced image in BGR format
         """
-        enhanced = image.copy()
-
-        # 1. CLAHE - Contrast enhancement
-        if self.enhancement_config["clahe"]["enabled"]:
-            enhanced = self._apply_clahe(enhanced, adjustments)
-
-        # 2. White balance correction
-        if self.enhancement_config["white_balance"]["enabled"]:
-            enhanced = self._apply_white_balance(enhanced, adjustments)
+        # Every step returns a new array, so the input is never modified
+        enhanced = image
 
-        # 3. Brightness/Exposure correction
-        if self.enhancement_config["brightness"]["enabled"]:
-            enhanced = self._apply_brightness_correction(enhanced, adjustments)
+        for stage in self._stages:
+            # Noise reduction only runs on high-ISO images
+            if stage == self._apply_noise_reduction:
+                iso = self._extract_iso_from_exif(exif_dict)
+                if not iso or iso <= self.enhancement_config["noise_reduction"]["iso_threshold"]:
+                    continue
 
-        # 4. Saturation enhancement
-        if self.enhancement_config["saturation"]["enabled"]:
-            enhanced = self._apply_saturation_boost(enhanced, adjustments)
-
-        # 5. Noise reduction (conditional on ISO)
-        if self.enhancement_config["noise_reduction"]["enabled"]:
-            iso = self._extract_iso_from_exif(exif_data)
-            if iso and iso > self.enhancement_config["noise_reduction"]["iso_threshold"]:
-                enhanced = self._apply_noise_reduction(enhanced, adjustments)
-
-        # 6. Sharpening (last step)
-        if self.enhancement_config["sharpening"]["enabled"]:
-            enhanced = self._apply_sharpening(enhanced, adjustments)
+            enhanced = stage(enhanced, adjustments)
 
         return enhanced
 
@@ -257,23 +360,22 @@ class ImageProcessor:
             adjustments["contrast_delta"] = "disabled"
             return image
 
-        tile_size = self.enhancement_config["clahe"]["tile_grid_size"]
-
         # Convert to LAB color space for better results
         lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-        l_channel, a_channel, b_channel = cv2.split(lab)
+        l_channel = cv2.extractChannel(lab, 0)
 
         # Apply CLAHE to L channel only
-        clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(tile_size, tile_size))
-        l_enhanced = clahe.apply(l_channel)
+        l_enhanced = self._clahe.apply(l_channel)
 
         # Calculate contrast increase
-        contrast_delta = float(np.std(l_enhanced)) / float(np.std(l_channel)) - 1.0
+        std_before = cv2.meanStdDev(l_channel)[1][0][0]
+        std_after = cv2.meanStdDev(l_enhanced)[1][0][0]
+        contrast_delta = float(std_after) / float(std_before) - 1.0
         adjustments["contrast_delta"] = f"+{contrast_delta:.2%}"
 
-        # Merge back
-        lab_enhanced = cv2.merge([l_enhanced, a_channel, b_channel])
-        result = cv2.cvtColor(lab_enhanced, cv2.COLOR_LAB2BGR)
+        # Write L back in place (a and b are untouched, no split/merge copies)
+        cv2.insertChannel(l_enhanced, lab, 0)
+        result = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
 
         self.logger.debug(f"CLAHE applied: clip_limit={clip_limit}, contrast_delta={contrast_delta:.2%}")
         return result
@@ -290,9 +392,7 @@ class ImageProcessor:
             White-balanced image
         """
         # Gray world assumption: average color should be gray
-        avg_b = np.mean(image[:, :, 0])
-        avg_g = np.mean(image[:, :, 1])
-        avg_r = np.mean(image[:, :, 2])
+        avg_b, avg_g, avg_r = cv2.mean(_stats_sample(image))[:3]
 
         # Calculate scaling factors
         avg_gray = (avg_b + avg_g + avg_r) / 3
@@ -300,11 +400,11 @@ class ImageProcessor:
         scale_g = avg_gray / avg_g if avg_g > 0 else 1.0
         scale_r = avg_gray / avg_r if avg_r > 0 else 1.0
 
-        # Apply scaling with clipping
-        result = image.astype(np.float32)
-        result[:, :, 0] = np.clip(result[:, :, 0] * scale_b, 0, 255)
-        result[:, :, 1] = np.clip(result[:, :, 1] * scale_g, 0, 255)
-        result[:, :, 2] = np.clip(result[:, :, 2] * scale_r, 0, 255)
+        # Per-channel scaling is a fixed map on uint8 levels, so apply it as a
+        # lookup table (one pass, no float copy of the image)
+        scales = np.array([scale_b, scale_g, scale_r], dtype=np.float32)
+        lut = np.clip(_LEVELS[:, None] * scales, 0, 255).astype(np.uint8).reshape(256, 1, 3)
+        result = cv2.LUT(image, lut)
 
         adjustments["white_balance"] = {
             "scale_b": f"{scale_b:.3f}",
@@ -313,27 +413,53 @@ class ImageProcessor:
         }
 
         self.logger.debug(f"White balance applied: R={scale_r:.3f}, G={scale_g:.3f}, B={scale_b:.3f}")
-        return result.astype(np.uint8)
+        return result
 
-    def _apply_brightness_correction(self, image: np.ndarray, adjustments: Dict[str, Any]) -> np.ndarray:
+    def _apply_hsv_stage(self, image: np.ndarray, adjustments: Dict[str, Any]) -> np.ndarray:
         """
-        Apply automatic brightness/exposure correction.
+        Apply brightness correction and saturation boost in one HSV pass.
+
+        Both steps work in HSV, so the image is converted once and back once
+        instead of round-tripping through BGR between them.
 
         Args:
             image: Input BGR image
             adjustments: Dictionary to record adjustments
 
         Returns:
-            Brightness-corrected image
+            Enhanced image
         """
-        # Convert to HSV for brightness adjustment
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
-        v_channel = hsv[:, :, 2]
+        brightness_enabled = self.enhancement_config["brightness"]["enabled"]
+        saturation_enabled = self.enhancement_config["saturation"]["enabled"]
+
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        h_channel, s_channel, v_channel = cv2.split(hsv)
+
+        if brightness_enabled:
+            v_channel = self._apply_brightness_correction(v_channel, adjustments)
 
-        # Calculate current brightness distribution
+        if saturation_enabled:
+            s_channel = self._apply_saturation_boost(s_channel, adjustments)
+
+        return cv2.cvtColor(cv2.merge([h_channel, s_channel, v_channel]), cv2.COLOR_HSV2BGR)
+
+    def _apply_brightness_correction(self, v_channel: np.ndarray, adjustments: Dict[str, Any]) -> np.ndarray:
+        """
+        Apply automatic brightness/exposure correction.
+
+        Args:
+            v_channel: uint8 V (value) channel of the HSV image
+            adjustments: Dictionary to record adjustments
+
+        Returns:
+            Brightness-corrected V channel
+        """
+        # Calculate current brightness distribution; on uint8 data the
+        # percentiles come straight from the cumulative histogram
         target_percentile = self.enhancement_config["brightness"]["target_percentile"]
-        current_low = np.percentile(v_channel, target_percentile[0])
-        current_high = np.percentile(v_channel, target_percentile[1])
+        hist = cv2.calcHist([_stats_sample(v_channel)], [0], None, [256], [0, 256]).ravel()
+        cdf = np.cumsum(hist)
+        current_low, current_high = np.searchsorted(cdf, cdf[-1] * np.asarray(target_percentile) / 100.0).tolist()
 
         # Target: spread histogram to match percentile range
         target_low = 255 * (target_percentile[0] / 100.0)
@@ -355,41 +481,35 @@ class ImageProcessor:
             scale_adjusted = 1.0 + (scale - 1.0) * brightness_strength
             offset_adjusted = offset * brightness_strength
 
-            v_channel = np.clip(v_channel * scale_adjusted + offset_adjusted, 0, 255)
+            # Saturating affine map on uint8 levels, applied as a lookup table
+            lut = np.clip(_LEVELS * scale_adjusted + offset_adjusted, 0, 255).astype(np.uint8)
+            v_enhanced = cv2.LUT(v_channel, lut)
 
-            brightness_delta = (np.mean(v_channel) - np.mean(hsv[:, :, 2])) / 255.0
+            # Mean shift from the histogram, without another pass over the image
+            brightness_delta = float(np.dot(hist, lut.astype(np.float32) - _LEVELS)) / cdf[-1] / 255.0
             adjustments["brightness_delta"] = f"{brightness_delta:+.2%}"
 
-            hsv[:, :, 2] = v_channel
-            result = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
-
             self.logger.debug(f"Brightness adjusted: delta={brightness_delta:+.2%}")
-            return result
+            return v_enhanced
 
-        return image
+        return v_channel
 
-    def _apply_saturation_boost(self, image: np.ndarray, adjustments: Dict[str, Any]) -> np.ndarray:
+    def _apply_saturation_boost(self, s_channel: np.ndarray, adjustments: Dict[str, Any]) -> np.ndarray:
         """
         Apply subtle saturation boost.
 
         Args:
-            image: Input BGR image
+            s_channel: uint8 S (saturation) channel of the HSV image
             adjustments: Dictionary to record adjustments
 
         Returns:
-            Saturation-enhanced image
+            Saturation-enhanced S channel
         """
         boost_factor = self.enhancement_config["saturation"]["boost_factor"]
 
-        # Convert to HSV
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
-        s_channel = hsv[:, :, 1]
-
         # Apply boost with clipping
-        s_channel = np.clip(s_channel * boost_factor, 0, 255)
-        hsv[:, :, 1] = s_channel
-
-        result = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
+        lut = np.clip(_LEVELS * boost_factor, 0, 255).astype(np.uint8)
+        result = cv2.LUT(s_channel, lut)
 
         adjustments["saturation_boost"] = f"{(boost_factor - 1.0) * 100:.0f}%"
         self.logger.debug(f"Saturation boosted by {(boost_factor - 1.0) * 100:.0f}%")
@@ -408,19 +528,24 @@ class ImageProcessor:
             Noise-reduced image
         """
         strength = self.enhancement_config["noise_reduction"]["strength"]
+        algorithm = self._noise_algorithm
 
-        # Non-local means denoising (preserves edges)
-        result = cv2.fastNlMeansDenoisingColored(
-            image,
-            None,
-            h=strength,
-            hColor=strength,
-            templateWindowSize=7,
-            searchWindowSize=21,
-        )
+        if algorithm == "bilateral":
+            # Bilateral filter (edge-preserving, far cheaper than NLM)
+            result = cv2.bilateralFilter(image, d=9, sigmaColor=strength * 2, sigmaSpace=strength * 2)
+        else:
+            # Non-local means denoising (preserves edges)
+            result = cv2.fastNlMeansDenoisingColored(
+                image,
+                None,
+                h=strength,
+                hColor=strength,
+                templateWindowSize=7,
+                searchWindowSize=21,
+            )
 
-        adjustments["noise_reduction"] = f"strength={strength}"
-        self.logger.debug(f"Noise reduction applied: strength={strength}")
+        adjustments["noise_reduction"] = f"algorithm={algorithm}, strength={strength}"
+        self.logger.debug(f"Noise reduction applied: algorithm={algorithm}, strength={strength}")
 
         return result
 
@@ -449,30 +574,49 @@ class ImageProcessor:
 
         return result
 
-    def _extract_iso_from_exif(self, exif_data: Optional[bytes]) -> Optional[int]:
+    def _parse_exif(self, exif_data: Optional[bytes], file_path: Path) -> Optional[Dict[str, Any]]:
         """
-        Extract ISO value from EXIF data.
+        Parse EXIF bytes into a piexif dictionary.
 
         Args:
             exif_data: EXIF metadata bytes
+            file_path: Image the metadata came from (for logging)
 
         Returns:
-            ISO value or None if not found
+            piexif dictionary, or None if there is no readable EXIF
         """
         if not exif_data:
             return None
 
         try:
-            exif_dict = piexif.load(exif_data)
-            if piexif.ExifIFD.ISOSpeedRatings in exif_dict.get("Exif", {}):
-                iso = exif_dict["Exif"][piexif.ExifIFD.ISOSpeedRatings]
-                return int(iso) if isinstance(iso, (int, float)) else None
+            return piexif.load(exif_data)
         except Exception as e:
-            self.logger.debug(f"Could not extract ISO from EXIF: {e}")
+            self.logger.warning(f"Could not parse EXIF: {e}", file=str(file_path))
+            return None
 
-        return None
+    def _extract_iso_from_exif(self, exif_dict: Optional[Dict[str, Any]]) -> Optional[int]:
+        """
+        Extract ISO value from EXIF data.
+
+        Args:
+            exif_dict: Parsed EXIF metadata
 
-    def _save_image_with_exif(self, image: np.ndarray, output_path: Path, exif_data: Optional[bytes]) -> None:
+        Returns:
+            ISO value or None if not found
+        """
+        if not exif_dict:
+            return None
+
+        iso = exif_dict.get("Exif", {}).get(piexif.ExifIFD.ISOSpeedRatings)
+        return int(iso) if isinstance(iso, (int, float)) else None
+
+    def _save_image_with_exif(
+        self,
+        image: np.ndarray,
+        output_path: Path,
+        exif_data: Optional[bytes],
+        exif_dict: Optional[Dict[str, Any]]
+    ) -> None:
         """
         Save image with EXIF preservation and added processing tags.
 
@@ -480,6 +624,7 @@ class ImageProcessor:
             image: BGR image to save
             output_path: Output file path
             exif_data: Original EXIF data
+            exif_dict: Parsed original EXIF data
         """
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -487,37 +632,41 @@ class ImageProcessor:
         # Get JPEG quality from config
         jpeg_quality = self.config["processing"]["jpeg_quality"]
 
-        # Convert BGR to RGB for Pillow
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(image_rgb)
-
         # Prepare EXIF data
-        save_kwargs = {}
-
-        if exif_data and self.config["advanced"]["preserve_all_exif"]:
-            try:
-                # Load existing EXIF
-                exif_dict = piexif.load(exif_data)
-
-                # Add processing software tag
-                if self.config["advanced"]["add_processing_tag"]:
+        exif_bytes = None
+
+        if exif_dict and self.config["advanced"]["preserve_all_exif"]:
+            if not self.config["advanced"]["add_processing_tag"]:
+                # Nothing to change, keep the original bytes as-is
+                exif_bytes = exif_data
+            else:
+                try:
+                    # Add processing software tag
                     software_name = self.config["advanced"]["processing_software_name"]
                     exif_dict["0th"][piexif.ImageIFD.Software] = software_name.encode("utf-8")
 
                     # Add processing date
-                    from datetime import datetime
-
                     process_date = datetime.now().strftime("%Y:%m:%d %H:%M:%S")
                     exif_dict["0th"][piexif.ImageIFD.DateTime] = process_date.encode("utf-8")
 
-                # Dump EXIF back to bytes
-                exif_bytes = piexif.dump(exif_dict)
-                save_kwargs["exif"] = exif_bytes
+                    # Dump EXIF back to bytes
+                    exif_bytes = piexif.dump(exif_dict)
 
-            except Exception as e:
-                self.logger.warning(f"Could not preserve EXIF: {e}", output=str(output_path))
+                except Exception as e:
+                    self.logger.warning(f"Could not preserve EXIF: {e}", output=str(output_path))
+
+        # Encode with OpenCV, which takes BGR directly (no RGB/Pillow copies)
+        ok, encoded = cv2.imencode(
+            ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+        )
+        if not ok:
+            raise ValueError(f"Failed to encode image: {output_path}")
+
+        jpeg_bytes = encoded.tobytes()
+        if exif_bytes:
+            jpeg_bytes = _insert_exif_segment(jpeg_bytes, exif_bytes)
 
         # Save image
-        pil_image.save(output_path, "JPEG", quality=jpeg_quality, optimize=True, **save_kwargs)
+        output_path.write_bytes(jpeg_bytes)
 
-        self.logger.debug(f"Image saved: {output_path}", quality=jpeg_quality, exif_preserved=bool(exif_data))
+        self.logger.debug(f"Image saved: {output_path}", quality=jpeg_quality, exif_preserved=bool(exif_bytes))
@@ -3,13 +3,346 @@ Record Keeper for Photoner
 Maintains detailed processing records, audit trails, and cleanup reports.
 """
 
+import atexit
 import csv
 import json
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 import sqlite3
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Columns written by export_to_csv (header and SELECT must stay in sync)
+CSV_EXPORT_HEADER = [
+    'Timestamp',
+    'Original Path',
+    'Enhanced Path',
+    'Status',
+    'Processing Time (sec)',
+    'Error',
+    'Moved to Processed',
+    'Processed Folder Path'
+]
+
+# Write buffer for CSV exports; large exports are many small rows
+CSV_WRITE_BUFFER = 1 << 20
+
+CSV_EXPORT_SELECT = """
+    SELECT
+        timestamp,
+        input_path,
+        output_path,
+        status,
+        processing_time_sec,
+        error_message,
+        moved_to_processed,
+        processed_folder_path
+    FROM processing_records
+"""
+
+
+_INSERT_PROCESSING_RECORD_PREFIX = """
+    INSERT INTO processing_records (
+        timestamp,
+        input_path,
+        output_path,
+        original_size_bytes,
+        enhanced_size_bytes,
+        processing_time_sec,
+        status,
+        error_message,
+        profile,
+        adjustments,
+        moved_to_processed,
+        processed_folder_path
+    ) VALUES """
+
+_PROCESSING_RECORD_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_PROCESSING_RECORD = _INSERT_PROCESSING_RECORD_PREFIX + _PROCESSING_RECORD_PLACEHOLDERS
+
+# Rows per multi-row INSERT, keeping under SQLite's historic limit of 999
+# bound parameters per statement (12 per record)
+_RECORDS_PER_INSERT = 999 // 12
+
+# Per-connection settings; journal_mode=WAL is stored in the database file and
+# is set once in RecordKeeper._init_database
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-10000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+# Database schema, applied in one transaction by RecordKeeper._init_database
+_SCHEMA_SQL = """
+BEGIN;
+
+-- Main processing records table
+CREATE TABLE IF NOT EXISTS processing_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    input_path TEXT NOT NULL,
+    output_path TEXT,
+    original_size_bytes INTEGER,
+    enhanced_size_bytes INTEGER,
+    processing_time_sec REAL,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    profile TEXT,
+    adjustments TEXT,
+    moved_to_processed BOOLEAN,
+    processed_folder_path TEXT,
+    created_date TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Index for faster queries
+CREATE INDEX IF NOT EXISTS idx_input_path ON processing_records(input_path);
+CREATE INDEX IF NOT EXISTS idx_timestamp ON processing_records(timestamp);
+CREATE INDEX IF NOT EXISTS idx_status ON processing_records(status);
+
+-- Partial index for the cleanup queries: only moved, successful records,
+-- already in timestamp order. It carries every column those queries read
+-- (including the ones in its WHERE clause, which SQLite needs to treat it as
+-- covering), so they never touch the table itself.
+DROP INDEX IF EXISTS idx_cleanup;
+CREATE INDEX IF NOT EXISTS idx_cleanup_covering
+ON processing_records(
+    timestamp,
+    processed_folder_path,
+    original_size_bytes,
+    input_path,
+    output_path,
+    moved_to_processed,
+    status
+)
+WHERE moved_to_processed = 1 AND status = 'success';
+
+-- Cleanup tracking table
+CREATE TABLE IF NOT EXISTS cleanup_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cleanup_date TEXT NOT NULL,
+    files_deleted INTEGER,
+    space_freed_gb REAL,
+    directories_cleaned TEXT,
+    manifest_path TEXT,
+    created_date TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Per-day rollup of processing_records (UTC dates), kept current by a
+-- trigger so stats over N days read N rows instead of every record
+CREATE TABLE IF NOT EXISTS daily_stats (
+    date TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    successful INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    timed INTEGER NOT NULL,
+    sum_time_sec REAL NOT NULL,
+    sum_original_bytes INTEGER NOT NULL,
+    sum_enhanced_bytes INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats
+AFTER INSERT ON processing_records
+BEGIN
+    INSERT INTO daily_stats VALUES (
+        substr(NEW.timestamp, 1, 10),
+        1,
+        NEW.status = 'success',
+        NEW.status = 'failed',
+        NEW.status = 'skipped',
+        NEW.processing_time_sec IS NOT NULL,
+        COALESCE(NEW.processing_time_sec, 0),
+        COALESCE(NEW.original_size_bytes, 0),
+        COALESCE(NEW.enhanced_size_bytes, 0)
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        total = total + 1,
+        successful = successful + excluded.successful,
+        failed = failed + excluded.failed,
+        skipped = skipped + excluded.skipped,
+        timed = timed + excluded.timed,
+        sum_time_sec = sum_time_sec + excluded.sum_time_sec,
+        sum_original_bytes = sum_original_bytes + excluded.sum_original_bytes,
+        sum_enhanced_bytes = sum_enhanced_bytes + excluded.sum_enhanced_bytes;
+END;
+
+-- Databases from before the rollup existed: backfill it once. The trigger
+-- keeps daily_stats non-empty whenever processing_records is, so an empty
+-- rollup means it has never been filled.
+INSERT INTO daily_stats
+SELECT
+    substr(timestamp, 1, 10),
+    COUNT(*),
+    SUM(status = 'success'),
+    SUM(status = 'failed'),
+    SUM(status = 'skipped'),
+    COUNT(processing_time_sec),
+    COALESCE(SUM(processing_time_sec), 0),
+    COALESCE(SUM(original_size_bytes), 0),
+    COALESCE(SUM(enhanced_size_bytes), 0)
+FROM processing_records
+WHERE NOT EXISTS (SELECT 1 FROM daily_stats)
+GROUP BY 1;
+
+COMMIT;
+"""
+
+
+def _connect(db_path: Union[Path, str], **kwargs: Any) -> sqlite3.Connection:
+    """
+    Open a connection to the records database with our pragmas applied.
+
+    Args:
+        db_path: Path (or SQLite URI) of the processing records database
+        **kwargs: Extra arguments for sqlite3.connect
+
+    Returns:
+        SQLite connection
+    """
+    conn = sqlite3.connect(db_path, **kwargs)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@lru_cache(maxsize=None)
+def _insert_processing_records_sql(row_count: int) -> str:
+    """
+    Build an INSERT statement that writes several processing records at once.
+
+    Args:
+        row_count: Number of records in the statement
+
+    Returns:
+        SQL with one placeholder group per record
+    """
+    return _INSERT_PROCESSING_RECORD_PREFIX + ", ".join([_PROCESSING_RECORD_PLACEHOLDERS] * row_count)
+
+
+def _to_json(value: Any) -> str:
+    """
+    Serialize a value for a JSON text column.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _cutoff_iso(days: int) -> str:
+    """
+    Get the timestamp N days ago, formatted like the stored record timestamps.
+
+    Args:
+        days: How many days back
+
+    Returns:
+        UTC ISO timestamp with a "Z" suffix
+    """
+    return (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+
+
+def _file_size(path: Path) -> Optional[int]:
+    """
+    Get a file's size with a single stat call.
+
+    Args:
+        path: File to measure
+
+    Returns:
+        Size in bytes, or None if the file does not exist
+    """
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def _existing_paths(paths: Iterable[Optional[str]]) -> Set[str]:
+    """
+    Find which of many file paths exist, listing each directory once.
+
+    Args:
+        paths: File paths as stored in the database (None entries are ignored)
+
+    Returns:
+        The subset of paths that exist
+    """
+    by_directory: Dict[str, List[str]] = {}
+    for path in paths:
+        if path:
+            by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+    existing = set()
+    for directory, members in by_directory.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except PermissionError:
+            # Not listable, but entries may still be reachable
+            existing.update(path for path in members if os.path.exists(path))
+            continue
+        existing.update(path for path in members if os.path.basename(path) in names)
+
+    return existing
+
+
+def _export_csv_shard(db_path: Path, start: str, end: str, shard_path: Path) -> int:
+    """
+    Write records with start <= timestamp < end to a headerless CSV shard.
+
+    Runs in a worker process for parallel exports, so it opens its own
+    database connection.
+
+    Args:
+        db_path: Path to the processing records database
+        start: Inclusive lower timestamp bound
+        end: Exclusive upper timestamp bound
+        shard_path: CSV file to write
+
+    Returns:
+        Number of rows written
+    """
+    row_count = 0
+    with _connect(db_path) as conn, open(
+        shard_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER
+    ) as csvfile:
+        cursor = conn.cursor()
+        cursor.execute(
+            CSV_EXPORT_SELECT + " WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp DESC",
+            (start, end)
+        )
+
+        # Stream rows straight from the cursor instead of materializing them
+        writer = csv.writer(csvfile)
+        for row in cursor:
+            writer.writerow(row)
+            row_count += 1
+
+    return row_count
+
 
 class RecordKeeper:
     """
@@ -40,64 +373,58 @@ class RecordKeeper:
         self.reports_dir = Path(config["paths"]["logs"]) / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
+        # One writer connection for the lifetime of the keeper; the lock
+        # serializes callers from different threads. Autocommit mode: single
+        # statements commit on their own and flush() opens its own transaction
+        self._conn = _connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._write_lock = threading.Lock()
+
+        # Processing records are inserted in batches (1 = insert each record)
+        self._batch_size = max(1, config.get("logging", {}).get("record_batch_size", 1))
+        self._pending_records: List[Tuple] = []
+        atexit.register(self.flush)
+
         # Initialize database
         self._init_database()
 
+        # Reports read through their own read-only connection, which under WAL
+        # never waits on (or blocks) the writer
+        self._read_conn = _connect(self.db_path.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+        self._read_conn.execute("PRAGMA query_only=1")
+        self._read_lock = threading.Lock()
+
+    def flush(self) -> None:
+        """Write buffered processing records to the database in one transaction."""
+        with self._write_lock:
+            if not self._pending_records:
+                return
+            with self._conn as conn:
+                # Take the write lock up front rather than upgrading from a
+                # read lock at the first INSERT
+                conn.execute("BEGIN IMMEDIATE")
+                # Multi-row VALUES: one statement execution per chunk of records
+                pending = self._pending_records
+                for start in range(0, len(pending), _RECORDS_PER_INSERT):
+                    chunk = pending[start:start + _RECORDS_PER_INSERT]
+                    conn.execute(_insert_processing_records_sql(len(chunk)), list(chain.from_iterable(chunk)))
+            self._pending_records.clear()
+
+    def close(self) -> None:
+        """Flush buffered records and close the database connection."""
+        self.flush()
+        atexit.unregister(self.flush)
+        with self._write_lock:
+            self._conn.close()
+        with self._read_lock:
+            self._read_conn.close()
+
     def _init_database(self) -> None:
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Main processing records table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS processing_records (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    input_path TEXT NOT NULL,
-                    output_path TEXT,
-                    original_size_bytes INTEGER,
-                    enhanced_size_bytes INTEGER,
-                    processing_time_sec REAL,
-                    status TEXT NOT NULL,
-                    error_message TEXT,
-                    profile TEXT,
-                    adjustments TEXT,
-                    moved_to_processed BOOLEAN,
-                    processed_folder_path TEXT,
-                    created_date TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Index for faster queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_input_path
-                ON processing_records(input_path)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp
-                ON processing_records(timestamp)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_status
-                ON processing_records(status)
-            """)
-
-            # Cleanup tracking table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cleanup_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    cleanup_date TEXT NOT NULL,
-                    files_deleted INTEGER,
-                    space_freed_gb REAL,
-                    directories_cleaned TEXT,
-                    manifest_path TEXT,
-                    created_date TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            conn.commit()
+        with self._write_lock:
+            # WAL lets report queries read while records are being written,
+            # and with synchronous=NORMAL commits don't fsync every insert
+            self._conn.execute("PRAGMA journal_mode=WAL").fetchone()
+            self._conn.executescript(_SCHEMA_SQL)
 
         self.logger.info(f"Record keeper initialized: {self.db_path}")
 
@@ -110,8 +437,10 @@ class RecordKeeper:
         error_message: Optional[str] = None,
         adjustments: Optional[Dict[str, Any]] = None,
         moved_to_processed: bool = False,
-        processed_folder_path: Optional[Path] = None
-    ) -> int:
+        processed_folder_path: Optional[Path] = None,
+        original_size: Optional[int] = None,
+        enhanced_size: Optional[int] = None
+    ) -> Optional[int]:
         """
         Record a processing event in the database.
 
@@ -124,51 +453,46 @@ class RecordKeeper:
             adjustments: Enhancement adjustments made
             moved_to_processed: Whether original was moved
             processed_folder_path: Where original was moved to
+            original_size: Size of the original in bytes, if the caller already
+                knows it (otherwise the file is stat'ed)
+            enhanced_size: Size of the enhanced image in bytes, likewise
 
         Returns:
-            Record ID
+            Record ID, or None if the record was buffered for a batched insert
+            (see logging.record_batch_size)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Get file sizes
-            original_size = input_path.stat().st_size if input_path.exists() else None
-            enhanced_size = output_path.stat().st_size if output_path and output_path.exists() else None
-
-            cursor.execute("""
-                INSERT INTO processing_records (
-                    timestamp,
-                    input_path,
-                    output_path,
-                    original_size_bytes,
-                    enhanced_size_bytes,
-                    processing_time_sec,
-                    status,
-                    error_message,
-                    profile,
-                    adjustments,
-                    moved_to_processed,
-                    processed_folder_path
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.utcnow().isoformat() + "Z",
-                str(input_path),
-                str(output_path) if output_path else None,
-                original_size,
-                enhanced_size,
-                processing_time,
-                status,
-                error_message,
-                self.config["enhancement"]["profile"],
-                json.dumps(adjustments) if adjustments else None,
-                moved_to_processed,
-                str(processed_folder_path) if processed_folder_path else None
-            ))
-
-            conn.commit()
-            record_id = cursor.lastrowid
-
-        return record_id
+        # Get file sizes (before touching the database)
+        if original_size is None:
+            original_size = _file_size(input_path)
+        if enhanced_size is None and output_path:
+            enhanced_size = _file_size(output_path)
+
+        record = (
+            datetime.utcnow().isoformat() + "Z",
+            str(input_path),
+            str(output_path) if output_path else None,
+            original_size,
+            enhanced_size,
+            processing_time,
+            status,
+            error_message,
+            self.config["enhancement"]["profile"],
+            _to_json(adjustments) if adjustments else None,
+            moved_to_processed,
+            str(processed_folder_path) if processed_folder_path else None
+        )
+
+        if self._batch_size == 1:
+            with self._write_lock, self._conn as conn:
+                return conn.execute(INSERT_PROCESSING_RECORD, record).lastrowid
+
+        with self._write_lock:
+            self._pending_records.append(record)
+            batch_full = len(self._pending_records) >= self._batch_size
+
+        if batch_full:
+            self.flush()
+        return None
 
     def get_processing_stats(self, days: int = 1) -> Dict[str, Any]:
         """
@@ -180,45 +504,76 @@ class RecordKeeper:
         Returns:
             Dictionary of statistics
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+        # Include records still waiting in the insert buffer
+        self.flush()
 
-        with sqlite3.connect(self.db_path) as conn:
+        cutoff_date = _cutoff_iso(days)
+
+        # Whole days after the cutoff come from the daily rollup; the
+        # (partial) cutoff day itself is read from the records
+        next_day = (date.fromisoformat(cutoff_date[:10]) + timedelta(days=1)).isoformat()
+
+        with self._read_lock, self._read_conn as conn:
             cursor = conn.cursor()
 
             # Total counts
             cursor.execute("""
                 SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped,
-                    AVG(processing_time_sec) as avg_time,
-                    SUM(original_size_bytes) as total_original_bytes,
-                    SUM(enhanced_size_bytes) as total_enhanced_bytes
-                FROM processing_records
-                WHERE timestamp >= ?
-            """, (cutoff_date,))
+                    SUM(total),
+                    SUM(successful),
+                    SUM(failed),
+                    SUM(skipped),
+                    SUM(timed),
+                    SUM(sum_time_sec),
+                    SUM(sum_original_bytes),
+                    SUM(sum_enhanced_bytes)
+                FROM (
+                    SELECT
+                        total, successful, failed, skipped, timed,
+                        sum_time_sec, sum_original_bytes, sum_enhanced_bytes
+                    FROM daily_stats
+                    WHERE date >= ?
+
+                    UNION ALL
+
+                    SELECT
+                        COUNT(*),
+                        SUM(status = 'success'),
+                        SUM(status = 'failed'),
+                        SUM(status = 'skipped'),
+                        COUNT(processing_time_sec),
+                        SUM(processing_time_sec),
+                        SUM(original_size_bytes),
+                        SUM(enhanced_size_bytes)
+                    FROM processing_records
+                    WHERE timestamp >= ? AND timestamp < ?
+                )
+            """, (next_day, cutoff_date, next_day))
 
             row = cursor.fetchone()
 
+        avg_time = row[5] / row[4] if row[4] else None
+
         return {
             "period_days": days,
             "total_processed": row[0] or 0,
             "successful": row[1] or 0,
             "failed": row[2] or 0,
             "skipped": row[3] or 0,
-            "avg_processing_time_sec": round(row[4], 2) if row[4] else 0,
-            "total_original_size_gb": round((row[5] or 0) / (1024**3), 2),
-            "total_enhanced_size_gb": round((row[6] or 0) / (1024**3), 2),
+            "avg_processing_time_sec": round(avg_time, 2) if avg_time else 0,
+            "total_original_size_gb": round((row[6] or 0) / (1024**3), 2),
+            "total_enhanced_size_gb": round((row[7] or 0) / (1024**3), 2),
         }
 
-    def export_to_csv(self, output_file: Optional[Path] = None, days: int = 30) -> Path:
+    def export_to_csv(self, output_file: Optional[Path] = None, days: int = 30, workers: int = 1) -> Path:
         """
         Export processing records to CSV.
 
         Args:
             output_file: Output CSV path (default: reports/processing_YYYY-MM-DD.csv)
             days: Export records from last N days
+            workers: Number of worker processes; >1 writes one shard per month
+                in parallel and concatenates them
 
         Returns:
             Path to created CSV file
@@ -227,44 +582,88 @@ class RecordKeeper:
             timestamp = datetime.now().strftime("%Y-%m-%d")
             output_file = self.reports_dir / f"processing_{timestamp}.csv"
 
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+        cutoff_date = _cutoff_iso(days)
+
+        # Include records still waiting in the insert buffer
+        self.flush()
+
+        if workers > 1:
+            row_count = self._export_to_csv_parallel(output_file, cutoff_date, workers)
+            self.logger.info(f"Exported {row_count} records to {output_file}")
+            return output_file
+
+        row_count = 0
+        with self._read_lock, self._read_conn as conn, open(
+            output_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER
+        ) as csvfile:
+            cursor = conn.cursor()
+            cursor.execute(
+                CSV_EXPORT_SELECT + " WHERE timestamp >= ? ORDER BY timestamp DESC",
+                (cutoff_date,)
+            )
+
+            # Write CSV, streaming rows straight from the cursor
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_EXPORT_HEADER)
+            for row in cursor:
+                writer.writerow(row)
+                row_count += 1
+
+        self.logger.info(f"Exported {row_count} records to {output_file}")
+        return output_file
+
+    def _export_to_csv_parallel(self, output_file: Path, cutoff_date: str, workers: int) -> int:
+        """
+        Export records to CSV by writing monthly shards in worker processes.
+
+        Args:
+            output_file: Final CSV path
+            cutoff_date: Only export records with timestamp >= cutoff_date
+            workers: Number of worker processes
 
-        with sqlite3.connect(self.db_path) as conn:
+        Returns:
+            Number of rows exported
+        """
+        with self._read_lock, self._read_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT
-                    timestamp,
-                    input_path,
-                    output_path,
-                    status,
-                    processing_time_sec,
-                    error_message,
-                    moved_to_processed,
-                    processed_folder_path
+                SELECT DISTINCT substr(timestamp, 1, 7)
                 FROM processing_records
                 WHERE timestamp >= ?
-                ORDER BY timestamp DESC
+                ORDER BY 1 DESC
             """, (cutoff_date,))
-
-            rows = cursor.fetchall()
-
-        # Write CSV
-        with open(output_file, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([
-                'Timestamp',
-                'Original Path',
-                'Enhanced Path',
-                'Status',
-                'Processing Time (sec)',
-                'Error',
-                'Moved to Processed',
-                'Processed Folder Path'
-            ])
-            writer.writerows(rows)
-
-        self.logger.info(f"Exported {len(rows)} records to {output_file}")
-        return output_file
+            months = [row[0] for row in cursor.fetchall()]
+
+        # Newest month first so the concatenated file stays in timestamp DESC order
+        shards = []
+        for month in months:
+            year, month_num = map(int, month.split("-"))
+            next_month = f"{year + month_num // 12:04d}-{month_num % 12 + 1:02d}"
+            shard_path = self.reports_dir / f".{output_file.stem}.{month}.part"
+            shards.append((max(cutoff_date, month), next_month, shard_path))
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_export_csv_shard, self.db_path, start, end, shard_path)
+                    for start, end, shard_path in shards
+                ]
+                row_count = sum(future.result() for future in futures)
+
+            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+                csv.writer(csvfile).writerow(CSV_EXPORT_HEADER)
+
+            with open(output_file, 'ab') as out:
+                for _, _, shard_path in shards:
+                    with open(shard_path, 'rb') as shard:
+                        shutil.copyfileobj(shard, out)
+
+        finally:
+            for _, _, shard_path in shards:
+                if shard_path.exists():
+                    shard_path.unlink()
+
+        return row_count
 
     def get_cleanup_candidates(self) -> List[Dict[str, Any]]:
         """
@@ -273,9 +672,12 @@ class RecordKeeper:
         Returns:
             List of cleanup candidates with metadata
         """
+        # Include records still waiting in the insert buffer
+        self.flush()
+
         candidates = []
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_lock, self._read_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
@@ -284,26 +686,30 @@ class RecordKeeper:
                     processed_folder_path,
                     original_size_bytes,
                     timestamp
-                FROM processing_records
+                FROM processing_records INDEXED BY idx_cleanup_covering
                 WHERE moved_to_processed = 1
                 AND status = 'success'
                 ORDER BY timestamp
             """)
 
-            for row in cursor.fetchall():
-                input_path = Path(row[0])
-                processed_path = Path(row[2]) if row[2] else None
-
-                # Check if file still exists in processed folder
-                if processed_path and processed_path.exists():
-                    candidates.append({
-                        "original_location": str(input_path),
-                        "current_location": str(processed_path),
-                        "enhanced_version": str(row[1]),
-                        "size_bytes": row[3],
-                        "size_mb": round(row[3] / (1024**2), 2),
-                        "processed_date": row[4]
-                    })
+            rows = cursor.fetchall()
+
+        # Check which files still exist in processed folders, one directory
+        # listing per folder rather than one stat per file
+        existing = _existing_paths(row[2] for row in rows)
+
+        for row in rows:
+            processed_location = row[2]
+
+            if processed_location in existing:
+                candidates.append({
+                    "original_location": row[0],
+                    "current_location": processed_location,
+                    "enhanced_version": str(row[1]),
+                    "size_bytes": row[3],
+                    "size_mb": round(row[3] / (1024**2), 2),
+                    "processed_date": row[4]
+                })
 
         return candidates
 
@@ -317,18 +723,21 @@ class RecordKeeper:
         Returns:
             Path to manifest file
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat() + "Z"
+        cutoff_date = _cutoff_iso(older_than_days)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         manifest_path = self.reports_dir / f"cleanup_manifest_{timestamp}.txt"
 
-        with sqlite3.connect(self.db_path) as conn:
+        # Include records still waiting in the insert buffer
+        self.flush()
+
+        with self._read_lock, self._read_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
                     processed_folder_path,
                     original_size_bytes,
                     timestamp
-                FROM processing_records
+                FROM processing_records INDEXED BY idx_cleanup_covering
                 WHERE moved_to_processed = 1
                 AND status = 'success'
                 AND timestamp <= ?
@@ -339,20 +748,32 @@ class RecordKeeper:
             files = cursor.fetchall()
 
         total_size = sum(row[1] for row in files if row[1])
-
-        with open(manifest_path, 'w') as f:
-            f.write(f"Cleanup Manifest Generated: {datetime.now().isoformat()}\n")
-            f.write(f"Files older than: {older_than_days} days\n")
-            f.write(f"Total files: {len(files)}\n")
-            f.write(f"Total size: {total_size / (1024**3):.2f} GB\n")
-            f.write("=" * 80 + "\n\n")
-            f.write("Files to delete (all have enhanced versions):\n\n")
-
-            for row in files:
-                file_path = Path(row[0])
-                if file_path.exists():
-                    size_mb = row[1] / (1024**2) if row[1] else 0
-                    f.write(f"{file_path}\t{size_mb:.2f} MB\t{row[2]}\n")
+        existing = _existing_paths(row[0] for row in files)
+
+        header = (
+            f"Cleanup Manifest Generated: {datetime.now().isoformat()}\n"
+            f"Files older than: {older_than_days} days\n"
+            f"Total files: {len(files)}\n"
+            f"Total size: {total_size / (1024**3):.2f} GB\n"
+            + "=" * 80 + "\n\n"
+            "Files to delete (all have enhanced versions):\n\n"
+        )
+
+        # Write beside the target and rename into place, so a crash never
+        # leaves a truncated manifest that looks complete
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        try:
+            with open(temp_path, 'w') as f:
+                f.write(header)
+                f.writelines(
+                    f"{row[0]}\t{(row[1] or 0) / (1024**2):.2f} MB\t{row[2]}\n"
+                    for row in files
+                    if row[0] in existing
+                )
+            os.replace(temp_path, manifest_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
 
         self.logger.info(f"Cleanup manifest created: {manifest_path}")
         self.logger.info(f"Ready for cleanup: {len(files)} files ({total_size / (1024**3):.2f} GB)")
@@ -369,7 +790,7 @@ class RecordKeeper:
             directories: List of directories cleaned
             manifest_path: Path to cleanup manifest
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write_lock, self._conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO cleanup_history (
@@ -383,7 +804,7 @@ class RecordKeeper:
                 datetime.utcnow().isoformat() + "Z",
                 files_deleted,
                 space_freed_gb,
-                json.dumps(directories),
+                _to_json(directories),
                 str(manifest_path)
             ))
             conn.commit()
@@ -400,9 +821,12 @@ class RecordKeeper:
         Returns:
             List of error summaries
         """
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+        # Include records still waiting in the insert buffer
+        self.flush()
+
+        cutoff_date = _cutoff_iso(days)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_lock, self._read_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
@@ -426,6 +850,3 @@ class RecordKeeper:
                 })
 
         return errors
-
-
-from datetime import timedelta